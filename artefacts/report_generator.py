@@ -14,6 +14,15 @@ from utils.logger import get_logger, LogEntry
 from core.verification import VerificationResult
 
 
+# Status tokens keyed by step outcome: (status, icon, passed, yes/no).
+# Shared across reports so rendering reuses the same string objects.
+_STEP_MD = {
+    True: ('✅ Success', '✅', '✅ Passed', '✅ Yes'),
+    False: ('❌ Failed', '❌', '❌ Failed', '❌ No'),
+}
+_CHECK_HTML = {True: ('pass', '✓'), False: ('fail', '✗')}
+
+
 @dataclass
 class StepResult:
     """Compatibility: single workflow step result."""
@@ -246,7 +255,7 @@ class ReportGenerator:
         path: Path
     ) -> None:
         """Generate Markdown format report."""
-        status_emoji = "✅" if report.success else "❌"
+        status_emoji = _STEP_MD[bool(report.success)][1]
         
         content = f"""# ENERGIS PDU Processing Report
 
@@ -269,15 +278,15 @@ class ReportGenerator:
 ## Step Results
 
 ### Firmware Upload
-- Status: {'✅ Success' if report.firmware_upload_success else '❌ Failed'}
+- Status: {_STEP_MD[bool(report.firmware_upload_success)][0]}
 - Time: {report.firmware_upload_time:.2f} seconds
 
 ### Provisioning
-- Status: {'✅ Success' if report.provisioning_success else '❌ Failed'}
+- Status: {_STEP_MD[bool(report.provisioning_success)][0]}
 - Time: {report.provisioning_time:.2f} seconds
 
 ### Verification
-- Status: {'✅ Passed' if report.verification_success else '❌ Failed'}
+- Status: {_STEP_MD[bool(report.verification_success)][2]}
 """
         
         # Add verification details
@@ -286,13 +295,13 @@ class ReportGenerator:
             content += "| Check | Expected | Actual | Result |\n"
             content += "|-------|----------|--------|--------|\n"
             for check in report.verification_result.checks:
-                result = "✅" if check.passed else "❌"
+                result = _STEP_MD[bool(check.passed)][1]
                 content += f"| {check.name} | {check.expected} | {check.actual} | {result} |\n"
         
         content += f"""
 ### Label
-- Generated: {'✅ Yes' if report.label_generated else '❌ No'}
-- Printed: {'✅ Yes' if report.label_printed else '❌ No'}
+- Generated: {_STEP_MD[bool(report.label_generated)][3]}
+- Printed: {_STEP_MD[bool(report.label_printed)][3]}
 """
         
         if report.label_path:
@@ -335,13 +344,13 @@ class ReportGenerator:
         verification_rows = ""
         if report.verification_result:
             for check in report.verification_result.checks:
-                result_class = "pass" if check.passed else "fail"
+                result_class, result_mark = _CHECK_HTML[bool(check.passed)]
                 verification_rows += f"""
                 <tr class="{result_class}">
                     <td>{check.name}</td>
                     <td>{check.expected}</td>
                     <td>{check.actual}</td>
-                    <td>{'✓' if check.passed else '✗'}</td>
+                    <td>{result_mark}</td>
                 </tr>
                 """
         
@@ -390,23 +399,23 @@ class ReportGenerator:
         
         <h2>Processing Steps</h2>
         <div class="step">
-            <span class="step-icon">{'✅' if report.firmware_upload_success else '❌'}</span>
+            <span class="step-icon">{_STEP_MD[bool(report.firmware_upload_success)][1]}</span>
             <span>Firmware Upload ({report.firmware_upload_time:.2f}s)</span>
         </div>
         <div class="step">
-            <span class="step-icon">{'✅' if report.provisioning_success else '❌'}</span>
+            <span class="step-icon">{_STEP_MD[bool(report.provisioning_success)][1]}</span>
             <span>Provisioning ({report.provisioning_time:.2f}s)</span>
         </div>
         <div class="step">
-            <span class="step-icon">{'✅' if report.verification_success else '❌'}</span>
+            <span class="step-icon">{_STEP_MD[bool(report.verification_success)][1]}</span>
             <span>Verification</span>
         </div>
         <div class="step">
-            <span class="step-icon">{'✅' if report.label_generated else '❌'}</span>
+            <span class="step-icon">{_STEP_MD[bool(report.label_generated)][1]}</span>
             <span>Label Generated</span>
         </div>
         <div class="step">
-            <span class="step-icon">{'✅' if report.label_printed else '❌'}</span>
+            <span class="step-icon">{_STEP_MD[bool(report.label_printed)][1]}</span>
             <span>Label Printed</span>
         </div>
         
@@ -497,9 +506,6 @@ class ReportGenerator:
         Returns:
             Destination path or None on error
         """
-        if not label_path.exists():
-            return None
-        
         device_dir = self.get_device_dir(serial_number)
         dest_dir = device_dir / "labels"
         dest_dir.mkdir(parents=True, exist_ok=True)
@@ -510,6 +516,8 @@ class ReportGenerator:
         try:
             shutil.copy2(label_path, dest_path)
             return dest_path
+        except FileNotFoundError:
+            return None  # No label was produced for this run
         except Exception as e:
             self._logger.error("ReportGenerator", f"Failed to copy label: {e}")
             return None
@@ -529,9 +537,6 @@ class ReportGenerator:
         Returns:
             Destination path or None on error
         """
-        if not log_path.exists():
-            return None
-        
         device_dir = self.get_device_dir(serial_number)
         dest_dir = device_dir / "logs"
         dest_dir.mkdir(parents=True, exist_ok=True)
@@ -542,6 +547,8 @@ class ReportGenerator:
         try:
             shutil.copy2(log_path, dest_path)
             return dest_path
+        except FileNotFoundError:
+            return None  # No serial log was produced for this run
         except Exception as e:
             self._logger.error("ReportGenerator", f"Failed to copy serial log: {e}")
             return None
\ No newline at end of file
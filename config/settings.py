@@ -48,6 +48,12 @@ class Settings:
     RP2040_USB_PID_BOOT = 0x0003  # RP2040 in BOOTSEL mode
     RP2040_VOLUME_NAME = "RPI-RP2"  # USB mass storage name when in boot mode
     DEVICE_SCAN_INTERVAL_MS = 1000  # How often to scan for devices
+    DEVICE_SCAN_INTERVAL_MS_MAX = 2000  # Idle backoff cap when nothing changes
+    DEVICE_WAIT_SCAN_INTERVAL_MS = 100  # Scan rate while a caller waits for a port
+    DEVICE_EVENT_SETTLE_MS = 3000  # Fast rescans after an OS device event (mounts lag uevents)
+    DEVICE_ACTIVE_SCAN_INTERVAL_MS = 500  # Scan rate for a while after the device set changes
+    DEVICE_ACTIVE_WINDOW_MS = 10000  # How long to keep the active scan rate after a change
+    DEVICE_SCAN_INTERVAL_MS_MAX_EVENTS = 5000  # Idle backoff cap when OS device events are available
     
     # Picotool configuration
     PICOTOOL_WINDOWS = "C:\\Users\\sdvid\\.pico-sdk\\picotool\\2.2.0-a4\\picotool\\picotool.exe"
@@ -57,13 +63,14 @@ class Settings:
     
     # Serial communication
     SERIAL_BAUDRATE = 115200
-    SERIAL_TIMEOUT = 1.0
+    SERIAL_READ_SLICE = 0.02  # Longest single blocking read while waiting for serial data
     SERIAL_WRITE_TIMEOUT = 1.0
     SERIAL_DETECT_TIMEOUT = 5.0  # Max wait for serial port after flash
     SERIAL_READY_TIMEOUT = 10.0  # Max wait for "SYSTEM READY"
     SERIAL_COMMAND_TIMEOUT = 2.0  # Max wait for command response
     SERIAL_REBOOT_WAIT = 10.0  # Wait time after reboot command (devices may take up to 10s)
     SERIAL_RECONNECT_TIMEOUT = 10.0  # Max wait for serial reconnection
+    QUICK_CHECK_TTL = 0.5  # Reuse the last SYSINFO for repeated quick checks within this window
     
     # Provisioning commands
     PROV_UNLOCK_CODE = "6D61676963"
@@ -86,6 +93,8 @@ class Settings:
     LABEL_DPI = 300
     LABEL_TEMPLATE_EU = "ENERGIS_rating_label_EU.svg"
     LABEL_TEMPLATE_US = "ENERGIS_rating_label_US.svg"
+    LABEL_TEMPLATE_EU_PATH = str(Path(TEMPLATE_DIR) / LABEL_TEMPLATE_EU)
+    LABEL_TEMPLATE_US_PATH = str(Path(TEMPLATE_DIR) / LABEL_TEMPLATE_US)
     LABEL_SERIAL_PLACEHOLDER = "SERIAL_NUMBER"
     PRINTER_NAME = "PM-241-BT"
     
@@ -93,6 +102,7 @@ class Settings:
     WINDOW_MIN_WIDTH = 1024
     WINDOW_MIN_HEIGHT = 768
     LOG_MAX_LINES = 1000
+    LOG_DEBUG = True  # Record DEBUG log entries (can be toggled under Tools)
     
     # Timeouts and retries
     MAX_RESET_RETRIES = 3
@@ -114,9 +124,7 @@ class Settings:
     @classmethod
     def get_label_template_path(cls, region: str) -> str:
         """Get full path to label template for region."""
-        if region == "US":
-            return str(Path(cls.TEMPLATE_DIR) / cls.LABEL_TEMPLATE_US)
-        return str(Path(cls.TEMPLATE_DIR) / cls.LABEL_TEMPLATE_EU)
+        return {"US": cls.LABEL_TEMPLATE_US_PATH}.get(region, cls.LABEL_TEMPLATE_EU_PATH)
 
 
 class _ConfigProxy:
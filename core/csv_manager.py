@@ -4,17 +4,44 @@ CSV management module for factory artefact tracking.
 Handles loading, saving, and managing the provisioning CSV database.
 """
 import csv
+import io
+import os
+import re
 import shutil
+import sys
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from config.settings import CONFIG
 from utils.logger import get_logger
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__ rows
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Buffer size for CSV reads/writes; large factory CSVs may live on network shares
+_IO_BUFFER_SIZE = 1 << 20
+
+# CSVRow base fields in constructor order
+_BASE_FIELDS = (
+    'serial_number', 'date_programmed', 'firmware_version',
+    'hardware_version', 'region_code', 'batch_id', 'notes'
+)
+
+# Membership set for the configured base columns (CSV_COLUMNS is a list)
+_BASE_COLS_SET = frozenset(CONFIG.CSV_COLUMNS)
+
+# Date column of a reprogramming event, e.g. "reprogram_3_date"
+_REPROGRAM_DATE_RE = re.compile(re.escape(CONFIG.CSV_REPROGRAM_PREFIX) + r"(\d+)_date")
+
+# Serials, programmed flags, dates, firmware versions and regions by row
+DisplayColumns = Tuple[List[str], List[bool], List[str], List[str], List[str]]
+
+
+@dataclass(**_SLOTS)
 class CSVRow:
     """Represents a single row in the provisioning CSV."""
     serial_number: str
@@ -26,20 +53,34 @@ class CSVRow:
     notes: str = ""
     # Dynamic reprogramming columns stored as dict
     extra_columns: Dict[str, str] = field(default_factory=dict)
+    # Cached "has been programmed" flag; kept in sync by CSVManager when
+    # date_programmed is written
+    is_programmed: bool = field(default=False, init=False, repr=False, compare=False)
+    # Cached number of recorded reprogramming events
+    reprogram_count: int = field(default=0, init=False, repr=False, compare=False)
+    # Dash-defaulted display strings for the row list; refreshed via
+    # refresh_display() when the underlying fields change
+    display_date: str = field(default="-", init=False, repr=False, compare=False)
+    display_fw: str = field(default="-", init=False, repr=False, compare=False)
+    display_region: str = field(default="-", init=False, repr=False, compare=False)
     
-    @property
-    def is_programmed(self) -> bool:
-        """Check if this row has been programmed."""
-        return bool(self.date_programmed.strip())
-    
-    @property
-    def reprogram_count(self) -> int:
-        """Count number of reprogramming events."""
-        return sum(
-            1 for k in self.extra_columns.keys()
-            if k.startswith(CONFIG.CSV_REPROGRAM_PREFIX)
+    def __post_init__(self) -> None:
+        self.is_programmed = bool(self.date_programmed.strip())
+        self.refresh_display()
+        # Each event writes three columns; count events by their filled date column
+        # (rows loaded alongside reprogrammed ones carry the same columns, empty)
+        prefix = CONFIG.CSV_REPROGRAM_PREFIX
+        self.reprogram_count = sum(
+            1 for k, v in self.extra_columns.items()
+            if v and k.startswith(prefix) and k.endswith("_date")
         )
     
+    def refresh_display(self) -> None:
+        """Recompute the display strings after fields were changed."""
+        self.display_date = self.date_programmed or "-"
+        self.display_fw = self.firmware_version or "-"
+        self.display_region = self.region_code or "-"
+    
     def to_dict(self, all_columns: List[str]) -> Dict[str, str]:
         """Convert to dict for CSV writing."""
         result = {
@@ -60,8 +101,7 @@ class CSVRow:
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> 'CSVRow':
         """Create CSVRow from dict."""
-        base_cols = CONFIG.CSV_COLUMNS
-        extra = {k: v for k, v in data.items() if k not in base_cols}
+        extra = {k: v for k, v in data.items() if k not in _BASE_COLS_SET}
         
         return cls(
             serial_number=data.get('serial_number', ''),
@@ -86,9 +126,33 @@ class CSVManager:
         self._logger = get_logger()
         self._path: Optional[Path] = None
         self._rows: List[CSVRow] = []
+        # Tuple view returned by `rows`; rebuilt lazily after a load
+        self._rows_snapshot: Optional[Tuple[CSVRow, ...]] = None
+        # Column-wise display data for the row list; rebuilt lazily after a load
+        self._display_columns: Optional[DisplayColumns] = None
+        self._serial_index: Dict[str, int] = {}
         self._all_columns: List[str] = CONFIG.CSV_COLUMNS.copy()
+        self._row_plan: List[Tuple[str, str]] = []
         self._selected_index: Optional[int] = None
+        # Every row before this index is known to be programmed
+        self._next_unprogrammed_hint = 0
+        # Running count of programmed rows, kept current by update_selected_row
+        self._programmed_count = 0
         self._modified = False
+        # Incremental save state: lowest row index changed since the last save,
+        # whether the file's header matches _all_columns, the byte offset of
+        # each data row (None until indexed) and the file's (size, mtime_ns)
+        # as last written or indexed by us
+        self._dirty_from: Optional[int] = None
+        self._layout_synced = False
+        self._row_offsets: Optional[List[int]] = None
+        self._file_signature: Optional[Tuple[int, int]] = None
+        # (path, size, mtime_ns) of the CSV when the last backup was taken
+        self._last_backup_key: Optional[Tuple[str, int, int]] = None
+        self._last_backup_path: Optional[Path] = None
+        # Guards swapping in freshly loaded state (see load_async)
+        self._load_lock = threading.Lock()
+        self._rebuild_row_plan()
     
     @property
     def is_loaded(self) -> bool:
@@ -101,9 +165,33 @@ class CSVManager:
         return self._path
     
     @property
-    def rows(self) -> List[CSVRow]:
-        """Get all rows."""
-        return self._rows.copy()
+    def rows(self) -> Tuple[CSVRow, ...]:
+        """Get all rows (shared immutable view)."""
+        snapshot = self._rows_snapshot
+        if snapshot is None:
+            snapshot = self._rows_snapshot = tuple(self._rows)
+        return snapshot
+    
+    @property
+    def display_columns(self) -> "DisplayColumns":
+        """
+        Get the row list's display fields as parallel lists.
+        
+        Returns:
+            (serials, programmed flags, dates, firmware versions, regions),
+            each indexed by row and kept current by update_selected_row
+        """
+        columns = self._display_columns
+        if columns is None:
+            rows = self._rows
+            columns = self._display_columns = (
+                [r.serial_number for r in rows],
+                [r.is_programmed for r in rows],
+                [r.display_date for r in rows],
+                [r.display_fw for r in rows],
+                [r.display_region for r in rows],
+            )
+        return columns
     
     @property
     def row_count(self) -> int:
@@ -131,6 +219,9 @@ class CSVManager:
         """
         Load CSV file.
         
+        The file is parsed into local structures first and swapped in under
+        a lock, so a failed load leaves the previous contents untouched.
+        
         Args:
             path: Path to CSV file
         
@@ -144,43 +235,130 @@ class CSVManager:
             return False
         
         try:
-            self._rows.clear()
-            self._all_columns = CONFIG.CSV_COLUMNS.copy()
-            
-            with open(file_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                if reader.fieldnames:
-                    # Capture all columns including extras
-                    for col in reader.fieldnames:
-                        if col not in self._all_columns:
-                            self._all_columns.append(col)
-                
-                for row_data in reader:
-                    self._rows.append(CSVRow.from_dict(row_data))
-            
+            parsed = self._parse_csv(file_path)
+        except Exception as e:
+            self._logger.error("CSVManager", f"Failed to load CSV: {e}")
+            return False
+        
+        rows, serial_index, all_columns, header, signature = parsed
+        programmed_count = sum(1 for r in rows if r.is_programmed)
+        with self._load_lock:
+            self._rows = rows
+            self._rows_snapshot = None
+            self._display_columns = None
+            self._programmed_count = programmed_count
+            self._serial_index = serial_index
+            self._all_columns = all_columns
+            self._rebuild_row_plan()
             self._path = file_path
             self._modified = False
+            self._dirty_from = None
+            self._layout_synced = header == all_columns
+            self._row_offsets = None
+            self._file_signature = signature
             self._selected_index = None
+            self._next_unprogrammed_hint = 0
+        
+        self._logger.info(
+            "CSVManager",
+            f"Loaded {len(rows)} rows from {file_path.name}"
+        )
+        
+        # Auto-select next unprogrammed row
+        self.select_next_unprogrammed()
+        
+        return True
+    
+    def load_async(self, path: str, on_complete: Optional[Callable[[bool], None]] = None) -> threading.Thread:
+        """
+        Load CSV file on a background thread.
+        
+        Parsing runs off the caller's thread; the loaded state is swapped in
+        atomically once complete. `on_complete` is invoked from the worker
+        thread, so GUI callers must marshal it onto their own event loop.
+        
+        Args:
+            path: Path to CSV file
+            on_complete: Callback receiving the load result
+        
+        Returns:
+            The started worker thread
+        """
+        thread = threading.Thread(
+            target=self._load_worker,
+            args=(path, on_complete),
+            daemon=True
+        )
+        thread.start()
+        return thread
+    
+    def _load_worker(self, path: str, on_complete: Optional[Callable[[bool], None]]) -> None:
+        """Background body of load_async."""
+        ok = self.load(path)
+        if on_complete:
+            on_complete(ok)
+    
+    def _parse_csv(
+        self,
+        file_path: Path
+    ) -> Tuple[List[CSVRow], Dict[str, int], List[str], List[str], Optional[Tuple[int, int]]]:
+        """
+        Parse a CSV file without touching manager state.
+        
+        Returns:
+            Tuple of (rows, serial index, all columns, file header, file signature)
+        """
+        rows: List[CSVRow] = []
+        serial_index: Dict[str, int] = {}
+        all_columns = CONFIG.CSV_COLUMNS.copy()
+        
+        with open(file_path, 'r', newline='', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader, None) or []
             
-            self._logger.info(
-                "CSVManager",
-                f"Loaded {len(self._rows)} rows from {file_path.name}"
-            )
+            # Capture all columns including extras
+            for col in header:
+                if col not in all_columns:
+                    all_columns.append(col)
             
-            # Auto-select next unprogrammed row
-            self.select_next_unprogrammed()
+            # Resolve column positions once instead of per-row dict lookups
+            base_positions = [
+                header.index(name) if name in header else -1
+                for name in _BASE_FIELDS
+            ]
+            extra_positions = [
+                (i, name) for i, name in enumerate(header)
+                if name not in _BASE_COLS_SET
+            ]
             
-            return True
+            for values in reader:
+                if not values:
+                    continue  # Blank line (DictReader skipped these too)
+                n = len(values)
+                row = CSVRow(
+                    *[values[i] if 0 <= i < n else "" for i in base_positions],
+                    extra_columns={
+                        name: values[i] if i < n else ""
+                        for i, name in extra_positions
+                    }
+                )
+                # Keep the first occurrence, matching linear-scan semantics
+                serial_index.setdefault(row.serial_number, len(rows))
+                rows.append(row)
         
-        except Exception as e:
-            self._logger.error("CSVManager", f"Failed to load CSV: {e}")
-            return False
+        return rows, serial_index, all_columns, header, self._stat_signature(file_path)
     
-    def save(self) -> bool:
+    def save(self, incremental: bool = True) -> bool:
         """
         Save CSV file (overwrites original).
         
+        When possible only the rows from the first modified one onwards are
+        rewritten in place; the full file is rewritten after column changes
+        or if the file was changed by someone else since it was last indexed.
+        
+        Args:
+            incremental: Allow patching the file tail instead of a full rewrite
+        
         Returns:
             True if saved successfully
         """
@@ -188,6 +366,11 @@ class CSVManager:
             self._logger.error("CSVManager", "No file loaded")
             return False
         
+        if incremental and self._layout_synced:
+            saved = self._patch_csv_tail(self._path)
+            if saved is not None:
+                return saved
+        
         return self._write_csv(self._path)
     
     def save_as(self, path: str) -> bool:
@@ -213,15 +396,30 @@ class CSVManager:
         Returns:
             Backup file path or None on failure
         """
-        if not self._path or not self._path.exists():
+        if not self._path:
             return None
         
+        signature = self._stat_signature(self._path)
+        if signature is None:
+            return None
+        
+        # Nothing changed on disk since the last backup: reuse it
+        backup_key = (str(self._path),) + signature
+        if (
+            backup_key == self._last_backup_key
+            and self._last_backup_path is not None
+            and self._last_backup_path.exists()
+        ):
+            return self._last_backup_path
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"{self._path.stem}_backup_{timestamp}{self._path.suffix}"
         backup_path = self._path.parent / backup_name
         
         try:
             shutil.copy2(self._path, backup_path)
+            self._last_backup_key = backup_key
+            self._last_backup_path = backup_path
             self._logger.info("CSVManager", f"Created backup: {backup_name}")
             return backup_path
         except Exception as e:
@@ -231,13 +429,17 @@ class CSVManager:
     def _write_csv(self, path: Path) -> bool:
         """Write CSV to file."""
         try:
-            with open(path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self._all_columns)
-                writer.writeheader()
-                for row in self._rows:
-                    writer.writerow(row.to_dict(self._all_columns))
+            with open(path, 'w', newline='', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(self._all_columns)
+                writer.writerows(self._row_values(row) for row in self._rows)
             
             self._modified = False
+            self._dirty_from = None
+            self._layout_synced = True
+            # Offsets are re-indexed lazily on the next incremental save
+            self._row_offsets = None
+            self._file_signature = self._stat_signature(path)
             self._logger.info("CSVManager", f"Saved to {path.name}")
             return True
         
@@ -245,6 +447,115 @@ class CSVManager:
             self._logger.error("CSVManager", f"Failed to save CSV: {e}")
             return False
     
+    def _patch_csv_tail(self, path: Path) -> Optional[bool]:
+        """
+        Rewrite only the rows from the first modified one to the end of file.
+        
+        Returns:
+            True if saved, False on write failure, or None if the file layout
+            is unknown and a full rewrite is required
+        """
+        # A file changed behind our back gets a full rewrite, as before
+        if self._file_signature is None or self._stat_signature(path) != self._file_signature:
+            return None
+        
+        start = self._dirty_from
+        if start is None:
+            self._modified = False
+            return True
+        
+        if self._row_offsets is None:
+            try:
+                self._row_offsets = self._index_row_offsets(path)
+            except (OSError, UnicodeDecodeError, csv.Error):
+                self._row_offsets = None
+        if self._row_offsets is None or len(self._row_offsets) != len(self._rows):
+            self._row_offsets = None
+            return None
+        
+        try:
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            offset = self._row_offsets[start]
+            chunks: List[bytes] = []
+            for i in range(start, len(self._rows)):
+                writer.writerow(self._row_values(self._rows[i]))
+                data = buf.getvalue().encode('utf-8')
+                buf.seek(0)
+                buf.truncate()
+                self._row_offsets[i] = offset
+                offset += len(data)
+                chunks.append(data)
+            
+            with open(path, 'r+b') as f:
+                f.seek(self._row_offsets[start])
+                f.write(b"".join(chunks))
+                f.truncate()
+            
+            self._file_signature = self._stat_signature(path)
+            self._modified = False
+            self._dirty_from = None
+            self._logger.info(
+                "CSVManager",
+                f"Saved to {path.name} ({len(self._rows) - start} row(s) rewritten)"
+            )
+            return True
+        
+        except Exception as e:
+            self._row_offsets = None
+            self._logger.error("CSVManager", f"Failed to save CSV: {e}")
+            return False
+    
+    @staticmethod
+    def _stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+        """Get (size, mtime_ns) of a file, or None if it cannot be read."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+    
+    def _index_row_offsets(self, path: Path) -> Optional[List[int]]:
+        """Record the byte offset of each data row in the CSV file."""
+        line_starts = [0]
+        
+        with open(path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+            def lines():
+                pos = 0
+                for raw in f:
+                    pos += len(raw)
+                    line_starts.append(pos)
+                    yield raw.decode('utf-8')
+            
+            # csv.reader tracks consumed physical lines, which maps records
+            # (including ones with quoted newlines) back to byte offsets
+            reader = csv.reader(lines())
+            if next(reader, None) is None:
+                return None
+            offsets: List[int] = []
+            consumed = reader.line_num
+            for values in reader:
+                if values:
+                    offsets.append(line_starts[consumed])
+                consumed = reader.line_num
+        
+        return offsets
+    
+    def _row_values(self, row: CSVRow) -> List[str]:
+        """Build the output cell list for a row using the column plan."""
+        extra = row.extra_columns
+        return [
+            getattr(row, key) if kind == 'attr' else extra.get(key, "")
+            for kind, key in self._row_plan
+        ]
+    
+    def _rebuild_row_plan(self) -> None:
+        """Precompute how each output column is read from a CSVRow."""
+        self._row_plan = [
+            ('attr', col) if col in _BASE_COLS_SET else ('extra', col)
+            for col in self._all_columns
+        ]
+    
     def select_row(self, index: int) -> bool:
         """
         Select a row by index.
@@ -275,10 +586,14 @@ class CSVManager:
         Returns:
             True if found and selected
         """
-        for i, row in enumerate(self._rows):
-            if not row.is_programmed:
+        rows = self._rows
+        # Rows only ever become programmed, so resume from the last position
+        for i in range(self._next_unprogrammed_hint, len(rows)):
+            if not rows[i].is_programmed:
+                self._next_unprogrammed_hint = i
                 return self.select_row(i)
         
+        self._next_unprogrammed_hint = len(rows)
         self._logger.warning("CSVManager", "No unprogrammed rows available")
         return False
     
@@ -292,10 +607,10 @@ class CSVManager:
         Returns:
             True if found and selected
         """
-        for i, row in enumerate(self._rows):
-            if row.serial_number == serial_number:
-                return self.select_row(i)
-        return False
+        idx = self._serial_index.get(serial_number)
+        if idx is None:
+            return False
+        return self.select_row(idx)
     
     def update_selected_row(
         self,
@@ -339,7 +654,22 @@ class CSVManager:
         
         if mark_programmed:
             row.date_programmed = datetime.now().strftime(CONFIG.DATE_FORMAT)
+            if not row.is_programmed:
+                self._programmed_count += 1
+            row.is_programmed = True
+            if self._selected_index == self._next_unprogrammed_hint:
+                self._next_unprogrammed_hint += 1
+        row.refresh_display()
+        columns = self._display_columns
+        if columns is not None:
+            idx = self._selected_index
+            columns[1][idx] = row.is_programmed
+            columns[2][idx] = row.display_date
+            columns[3][idx] = row.display_fw
+            columns[4][idx] = row.display_region
         
+        if self._dirty_from is None or self._selected_index < self._dirty_from:
+            self._dirty_from = self._selected_index
         self._modified = True
         self._logger.info(
             "CSVManager",
@@ -349,7 +679,14 @@ class CSVManager:
     
     def _handle_reprogram(self, row: CSVRow) -> None:
         """Add reprogramming tracking columns."""
-        count = row.reprogram_count + 1
+        # Number after the highest recorded event, so gaps left by manual
+        # edits never lead to an existing event being overwritten
+        last = 0
+        for col, value in row.extra_columns.items():
+            match = _REPROGRAM_DATE_RE.fullmatch(col)
+            if match and value:
+                last = max(last, int(match.group(1)))
+        count = last + 1
         prefix = CONFIG.CSV_REPROGRAM_PREFIX
         
         # Add new columns if needed
@@ -360,11 +697,14 @@ class CSVManager:
         for col in [date_col, fw_col, reason_col]:
             if col not in self._all_columns:
                 self._all_columns.append(col)
+                self._row_plan.append(('extra', col))
+                self._layout_synced = False
         
         # Save previous values
         row.extra_columns[date_col] = row.date_programmed
         row.extra_columns[fw_col] = row.firmware_version
         row.extra_columns[reason_col] = f"Reprogrammed ({count})"
+        row.reprogram_count += 1
         
         self._logger.info(
             "CSVManager",
@@ -382,7 +722,7 @@ class CSVManager:
     def get_statistics(self) -> Dict[str, int]:
         """Get CSV statistics."""
         total = len(self._rows)
-        programmed = len(self.get_programmed_rows())
+        programmed = self._programmed_count
         return {
             'total': total,
             'programmed': programmed,
@@ -399,16 +739,17 @@ class CSVManager:
         Returns True on success, False if the row is not found or update fails.
         """
         # Find the row by serial
-        for i, row in enumerate(self._rows):
-            if row.serial_number == serial_number:
-                self._selected_index = i
-                return self.update_selected_row(
-                    firmware_version=firmware_version,
-                    hardware_version=row.hardware_version,
-                    region_code=row.region_code,
-                    batch_id=row.batch_id,
-                    notes=notes,
-                    mark_programmed=True
-                )
-        self._logger.warning("CSVManager", f"Serial not found in CSV: {serial_number}")
-        return False
\ No newline at end of file
+        idx = self._serial_index.get(serial_number)
+        if idx is None:
+            self._logger.warning("CSVManager", f"Serial not found in CSV: {serial_number}")
+            return False
+        row = self._rows[idx]
+        self._selected_index = idx
+        return self.update_selected_row(
+            firmware_version=firmware_version,
+            hardware_version=row.hardware_version,
+            region_code=row.region_code,
+            batch_id=row.batch_id,
+            notes=notes,
+            mark_programmed=True
+        )
\ No newline at end of file
@@ -4,13 +4,14 @@ RP2040 device detection module.
 Detects unprogrammed RP2040 devices appearing as USB mass storage (RPI-RP2).
 Also detects programmed devices appearing as serial ports.
 """
+import os
 import sys
 import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import psutil
 import serial.tools.list_ports
@@ -18,6 +19,21 @@ import serial.tools.list_ports
 from config.settings import CONFIG
 from utils.logger import get_logger
 
+# Optional OS device-event sources; without them the monitor only polls
+try:
+    import pyudev
+    UDEV_AVAILABLE = True
+except ImportError:
+    UDEV_AVAILABLE = False
+
+try:
+    import win32api
+    import win32con
+    import win32gui
+    WIN32_AVAILABLE = True
+except ImportError:
+    WIN32_AVAILABLE = False
+
 
 class DeviceState(Enum):
     """State of detected device."""
@@ -58,9 +74,35 @@ class DeviceDetector:
     def __init__(self):
         self._logger = get_logger()
         self._devices: Dict[str, DetectedDevice] = {}
+        # Immutable views handed out by the getters, rebuilt once per scan
+        self._devices_snapshot: Tuple[DetectedDevice, ...] = ()
+        self._bootsel_snapshot: Tuple[DetectedDevice, ...] = ()
+        self._serial_snapshot: Tuple[DetectedDevice, ...] = ()
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
+        # Wakes the monitor thread early (stop requests, new waiters)
+        self._wake_event = threading.Event()
+        # Signalled after scans that add devices; port waiters block on it
+        self._scan_cond = threading.Condition(self._lock)
+        self._waiters = 0
+        # Scans started so far, and the start number of the newest scan
+        # whose results were published; port waiters only trust scans
+        # started after they began waiting
+        self._scans_started = 0
+        self._scan_published = 0
+        # INFO_UF2.TXT verdict per mount point, dropped once the mount disappears
+        self._mount_cache: Dict[str, bool] = {}
+        self._last_scan_fp: Tuple[str, ...] = ()
+        self._volume_name_lower = CONFIG.RP2040_VOLUME_NAME.lower()
+        self._backoff_ms = CONFIG.DEVICE_SCAN_INTERVAL_MS
+        # Fast-rescan window opened by OS device events (monotonic deadline)
+        self._event_deadline = 0.0
+        # Faster polling after the device set changed (monotonic deadline)
+        self._active_until = 0.0
+        self._event_observer = None
+        self._event_hwnd = None
+        self._event_thread: Optional[threading.Thread] = None
         
         # Callbacks
         self._on_device_added: Optional[Callable[[DetectedDevice], None]] = None
@@ -109,62 +151,206 @@ class DeviceDetector:
             return
         
         self._running = True
+        self._wake_event.clear()
+        self._backoff_ms = CONFIG.DEVICE_SCAN_INTERVAL_MS
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
+        self._start_event_source()
         self._logger.info("DeviceDetector", "Started device monitoring")
     
     def stop(self) -> None:
         """Stop device monitoring thread."""
         self._running = False
+        self._stop_event_source()
+        self._wake_event.set()
+        with self._scan_cond:
+            self._scan_cond.notify_all()
         if self._thread:
             self._thread.join(timeout=2.0)
         self._logger.info("DeviceDetector", "Stopped device monitoring")
     
-    def get_devices(self) -> List[DetectedDevice]:
-        """Get list of currently detected devices."""
-        with self._lock:
-            return list(self._devices.values())
+    def get_devices(self) -> Tuple[DetectedDevice, ...]:
+        """Get currently detected devices (shared immutable snapshot)."""
+        return self._devices_snapshot
     
-    def get_bootsel_devices(self) -> List[DetectedDevice]:
-        """Get devices in BOOTSEL mode only."""
-        with self._lock:
-            return [d for d in self._devices.values() if d.state == DeviceState.BOOTSEL]
+    def get_bootsel_devices(self) -> Tuple[DetectedDevice, ...]:
+        """Get devices in BOOTSEL mode only (shared immutable snapshot)."""
+        return self._bootsel_snapshot
     
-    def get_serial_devices(self) -> List[DetectedDevice]:
-        """Get devices in serial mode only."""
-        with self._lock:
-            return [d for d in self._devices.values() if d.state == DeviceState.SERIAL]
+    def get_serial_devices(self) -> Tuple[DetectedDevice, ...]:
+        """Get devices in serial mode only (shared immutable snapshot)."""
+        return self._serial_snapshot
     
     def has_bootsel_device(self) -> bool:
         """Check if any BOOTSEL device is connected."""
-        return len(self.get_bootsel_devices()) > 0
+        return len(self._bootsel_snapshot) > 0
     
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
         while self._running:
+            changed = False
             try:
-                self._scan_devices()
+                changed = self._scan_devices()
             except Exception as e:
                 self._logger.error("DeviceDetector", f"Scan error: {e}")
             
-            time.sleep(CONFIG.DEVICE_SCAN_INTERVAL_MS / 1000.0)
+            # Back off while idle; poll faster for a while after any change
+            now = time.monotonic()
+            if changed:
+                self._backoff_ms = CONFIG.DEVICE_SCAN_INTERVAL_MS
+                self._active_until = now + CONFIG.DEVICE_ACTIVE_WINDOW_MS / 1000.0
+            else:
+                self._backoff_ms = min(self._backoff_ms * 2, self._idle_interval_cap_ms())
+            if self._waiters or now < self._event_deadline:
+                interval_ms = CONFIG.DEVICE_WAIT_SCAN_INTERVAL_MS
+            elif now < self._active_until:
+                interval_ms = CONFIG.DEVICE_ACTIVE_SCAN_INTERVAL_MS
+            else:
+                interval_ms = self._backoff_ms
+            
+            # Event wait lets stop() and new port waiters wake the thread immediately
+            self._wake_event.wait(interval_ms / 1000.0)
+            self._wake_event.clear()
+    
+    def _idle_interval_cap_ms(self) -> int:
+        """Longest idle poll interval; OS events cover plug-ins when available."""
+        if self._event_observer is not None or self._event_hwnd:
+            return CONFIG.DEVICE_SCAN_INTERVAL_MS_MAX_EVENTS
+        return CONFIG.DEVICE_SCAN_INTERVAL_MS_MAX
+    
+    def _start_event_source(self) -> None:
+        """
+        Subscribe to OS device notifications, if available.
+        
+        Events only wake the monitor loop; _scan_devices stays the single
+        source of truth, and polling continues as a fallback.
+        """
+        try:
+            if sys.platform.startswith('linux') and UDEV_AVAILABLE:
+                context = pyudev.Context()
+                monitor = pyudev.Monitor.from_netlink(context)
+                monitor.filter_by('block')
+                monitor.filter_by('tty')
+                observer = pyudev.MonitorObserver(
+                    monitor,
+                    callback=lambda device: self._on_os_device_event(),
+                    name="udev-device-monitor"
+                )
+                observer.daemon = True
+                observer.start()
+                self._event_observer = observer
+                self._logger.info("DeviceDetector", "Using udev device events")
+            elif sys.platform == 'win32' and WIN32_AVAILABLE:
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._win32_event_loop, args=(ready,), daemon=True
+                )
+                thread.start()
+                self._event_thread = thread
+                ready.wait(2.0)
+                if self._event_hwnd:
+                    self._logger.info("DeviceDetector", "Using WM_DEVICECHANGE events")
+        except Exception as e:
+            self._logger.warning("DeviceDetector", f"Device events unavailable, polling only: {e}")
     
-    def _scan_devices(self) -> None:
-        """Scan for RP2040 devices."""
+    def _stop_event_source(self) -> None:
+        """Unsubscribe from OS device notifications and join their threads."""
+        observer, self._event_observer = self._event_observer, None
+        if observer is not None:
+            try:
+                # stop() signals the observer thread and joins it
+                observer.stop()
+            except Exception:
+                pass
+        hwnd, self._event_hwnd = self._event_hwnd, None
+        if hwnd:
+            try:
+                win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
+            except Exception:
+                pass
+        thread, self._event_thread = self._event_thread, None
+        if thread is not None:
+            thread.join(timeout=2.0)
+    
+    def _win32_event_loop(self, ready: threading.Event) -> None:
+        """Pump a hidden window that receives WM_DEVICECHANGE broadcasts."""
+        # Volume and port arrivals are broadcast to top-level windows only,
+        # so this cannot be a message-only (HWND_MESSAGE) window
+        class_name = f"RP2040DeviceDetector{id(self)}"
+        instance = win32api.GetModuleHandle(None)
+        wc = win32gui.WNDCLASS()
+        wc.lpszClassName = class_name
+        wc.hInstance = instance
+        wc.lpfnWndProc = {
+            win32con.WM_DEVICECHANGE: self._on_wm_devicechange,
+            win32con.WM_DESTROY: lambda hwnd, msg, wparam, lparam: win32gui.PostQuitMessage(0),
+        }
+        try:
+            atom = win32gui.RegisterClass(wc)
+            self._event_hwnd = win32gui.CreateWindow(
+                atom, class_name, 0, 0, 0, 0, 0, 0, 0, instance, None
+            )
+        except Exception as e:
+            self._logger.warning("DeviceDetector", f"WM_DEVICECHANGE setup failed: {e}")
+            ready.set()
+            return
+        ready.set()
+        try:
+            win32gui.PumpMessages()
+        finally:
+            try:
+                win32gui.UnregisterClass(class_name, instance)
+            except Exception:
+                pass
+    
+    def _on_wm_devicechange(self, hwnd, msg, wparam, lparam) -> bool:
+        """Window procedure for WM_DEVICECHANGE."""
+        self._on_os_device_event()
+        return True
+    
+    def _on_os_device_event(self) -> None:
+        """Wake the monitor loop and rescan quickly while the device settles."""
+        self._event_deadline = time.monotonic() + CONFIG.DEVICE_EVENT_SETTLE_MS / 1000.0
+        self._backoff_ms = CONFIG.DEVICE_SCAN_INTERVAL_MS
+        self._wake_event.set()
+    
+    def _scan_devices(self) -> bool:
+        """
+        Scan for RP2040 devices.
+        
+        Returns:
+            True if any device was added or removed
+        """
         current_devices: Dict[str, DetectedDevice] = {}
+        with self._lock:
+            self._scans_started += 1
+            scan_number = self._scans_started
+        
+        # Enumerate OS state once per scan tick
+        partitions = psutil.disk_partitions(all=False)
+        ports = list(serial.tools.list_ports.comports())
         
         # Scan for BOOTSEL (mass storage) devices
-        bootsel = self._scan_bootsel_devices()
+        bootsel = self._scan_bootsel_devices(partitions)
         for dev in bootsel:
             current_devices[dev.device_id] = dev
         
         # Scan for serial port devices
-        serial_devs = self._scan_serial_devices()
+        serial_devs = self._scan_serial_devices(ports)
         for dev in serial_devs:
             current_devices[dev.device_id] = dev
         
+        # Device IDs encode the state (bootsel_/serial_), so the sorted ID
+        # tuple identifies the device set; unchanged ticks skip the diff
+        fingerprint = tuple(sorted(current_devices))
+        
         # Compare with previous state
         with self._lock:
+            if fingerprint == self._last_scan_fp:
+                self._set_devices(current_devices, scan_number)
+                return False
+            self._last_scan_fp = fingerprint
+            
             old_ids = set(self._devices.keys())
             new_ids = set(current_devices.keys())
             
@@ -186,19 +372,37 @@ class DeviceDetector:
                     self._on_device_added(dev)
             
             # Update state
-            self._devices = current_devices
+            self._set_devices(current_devices, scan_number)
             
             # Notify of any changes
             if (added or removed) and self._on_devices_changed:
                 self._on_devices_changed(list(self._devices.values()))
+            
+            return bool(added or removed)
+    
+    def _set_devices(self, devices: Dict[str, DetectedDevice], scan_number: int) -> None:
+        """Replace the device map and rebuild the getter snapshots (lock held)."""
+        self._scan_published = max(self._scan_published, scan_number)
+        if self._waiters:
+            self._scan_cond.notify_all()
+        self._devices = devices
+        snapshot = tuple(devices.values())
+        self._devices_snapshot = snapshot
+        self._bootsel_snapshot = tuple(d for d in snapshot if d.state == DeviceState.BOOTSEL)
+        self._serial_snapshot = tuple(d for d in snapshot if d.state == DeviceState.SERIAL)
     
-    def _scan_bootsel_devices(self) -> List[DetectedDevice]:
-        """Scan for RP2040 devices in BOOTSEL mode (USB mass storage)."""
+    def _scan_bootsel_devices(self, partitions: Optional[list] = None) -> List[DetectedDevice]:
+        """
+        Scan for RP2040 devices in BOOTSEL mode (USB mass storage).
+        
+        Args:
+            partitions: Result of psutil.disk_partitions() already taken this scan
+        """
         devices: List[DetectedDevice] = []
         candidates: List[str] = []
         
         # 1) Use mounted partitions
-        parts = psutil.disk_partitions(all=False)
+        parts = partitions if partitions is not None else psutil.disk_partitions(all=False)
         for partition in parts:
             mount = partition.mountpoint
             if sys.platform != "win32":
@@ -209,6 +413,17 @@ class DeviceDetector:
         
         # 2) On Linux, also probe common paths directly by volume label
         if sys.platform != "win32":
+            # The kernel-maintained by-label symlink appears as soon as the
+            # device enumerates; with no symlink and no FAT mount there is
+            # nothing to find, so skip the filesystem probes entirely
+            by_label = Path("/dev/disk/by-label") / CONFIG.RP2040_VOLUME_NAME
+            try:
+                by_label_exists = by_label.exists()
+            except OSError:
+                by_label_exists = False
+            if not by_label_exists and not candidates:
+                self._mount_cache.clear()
+                return devices
             try:
                 from pathlib import Path as _P
                 # Explicit per-user mount path probe
@@ -216,16 +431,28 @@ class DeviceDetector:
                 explicit = _P("/run/media") / user / CONFIG.RP2040_VOLUME_NAME
                 if explicit.exists():
                     candidates.append(str(explicit))
+                volume = CONFIG.RP2040_VOLUME_NAME
                 for root in ("/media", "/run/media", "/mnt"):
-                    r = _P(root)
-                    if not r.exists():
+                    # Volume label lives at <root>/<label> or <root>/<user>/<label>;
+                    # bounded scandir avoids walking whole mount trees every scan
+                    try:
+                        entries = list(os.scandir(root))
+                    except OSError:
                         continue
-                    # Look for directories named by the expected volume label
-                    for p in r.glob(f"**/{CONFIG.RP2040_VOLUME_NAME}"):
-                        candidates.append(str(p))
+                    for entry in entries:
+                        try:
+                            if not entry.is_dir():
+                                continue
+                        except OSError:
+                            continue
+                        if entry.name == volume:
+                            candidates.append(entry.path)
+                            continue
+                        candidate = os.path.join(entry.path, volume)
+                        if os.path.isdir(candidate):
+                            candidates.append(candidate)
                 # Check /dev/disk/by-label symlink to locate mount of RPI-RP2
-                by_label = _P("/dev/disk/by-label") / CONFIG.RP2040_VOLUME_NAME
-                if by_label.exists():
+                if by_label_exists:
                     try:
                         dev_path = str(by_label.resolve())
                         # Match mounted partitions for this device
@@ -275,40 +502,47 @@ class DeviceDetector:
                     description="RP2040 in BOOTSEL mode"
                 ))
         
+        # Forget mounts that are gone so a remount is probed afresh
+        if any(m not in seen for m in self._mount_cache):
+            self._mount_cache = {m: v for m, v in self._mount_cache.items() if m in seen}
+        
         return devices
     
     def _is_rpi_rp2_mount(self, mount_path: str) -> bool:
         """Check if mount point is an RPI-RP2 device."""
-        mount = Path(mount_path)
-        
         # Check for volume name in path (Windows: E:\\, Linux: /media/user/RPI-RP2)
-        if CONFIG.RP2040_VOLUME_NAME.lower() in str(mount).lower():
+        if self._volume_name_lower in mount_path.lower():
             return True
         
-        # Check for INFO_UF2.TXT file (definitive marker). Be robust to permission issues.
-        info_file = mount / "INFO_UF2.TXT"
-        try:
-            exists = info_file.exists()
-        except Exception:
-            # Permission denied or other filesystem errors: treat as not present
-            exists = False
+        cached = self._mount_cache.get(mount_path)
+        if cached is not None:
+            return cached
         
-        if exists:
-            try:
-                content = info_file.read_text(errors="ignore")
-                if "RP2040" in content or "RPI-RP2" in content:
-                    return True
-            except Exception:
-                # Ignore unreadable files
-                pass
+        # Check for INFO_UF2.TXT file (definitive marker). The markers sit in the
+        # first lines, so read a bounded prefix; a missing or unreadable file
+        # (permissions, still mounting) is not cached so it is retried next scan.
+        try:
+            with open(os.path.join(mount_path, "INFO_UF2.TXT"), "rb") as f:
+                head = f.read(256)
+        except OSError:
+            return False
         
-        return False
+        result = b"RP2040" in head or b"RPI-RP2" in head
+        self._mount_cache[mount_path] = result
+        return result
     
-    def _scan_serial_devices(self) -> List[DetectedDevice]:
-        """Scan for RP2040 devices appearing as serial ports."""
+    def _scan_serial_devices(self, ports: Optional[list] = None) -> List[DetectedDevice]:
+        """
+        Scan for RP2040 devices appearing as serial ports.
+        
+        Args:
+            ports: Result of list_ports.comports() already taken this scan
+        """
         devices = []
         
-        for port in serial.tools.list_ports.comports():
+        if ports is None:
+            ports = serial.tools.list_ports.comports()
+        for port in ports:
             # Check for Raspberry Pi VID
             if port.vid == CONFIG.RP2040_USB_VID:
                 device_id = f"serial_{port.device}"
@@ -324,13 +558,13 @@ class DeviceDetector:
         
         return devices
     
-    def scan_once(self) -> List[DetectedDevice]:
+    def scan_once(self) -> Tuple[DetectedDevice, ...]:
         """Perform a single scan and return devices (for manual refresh)."""
         self._scan_devices()
         return self.get_devices()
 
     # Backward-compatibility alias used by GUI
-    def scan_now(self) -> List[DetectedDevice]:
+    def scan_now(self) -> Tuple[DetectedDevice, ...]:
         """Compatibility method that performs a single scan and returns devices."""
         return self.scan_once()
     
@@ -356,22 +590,13 @@ class DeviceDetector:
         initial_ports = {p.device for p in serial.tools.list_ports.comports()}
         initial_ports |= exclude
         
-        start = time.time()
-        while (time.time() - start) < timeout:
-            current_ports = {p.device for p in serial.tools.list_ports.comports()}
-            new_ports = current_ports - initial_ports
-            
-            # Look for RP2040 ports
-            for port in serial.tools.list_ports.comports():
-                if port.device in new_ports:
-                    if port.vid == CONFIG.RP2040_USB_VID:
-                        self._logger.info(
-                            "DeviceDetector",
-                            f"New serial port detected: {port.device}"
-                        )
-                        return port.device
-            
-            time.sleep(0.1)
+        port = self._await_serial_port(lambda path: path not in initial_ports, timeout)
+        if port:
+            self._logger.info(
+                "DeviceDetector",
+                f"New serial port detected: {port}"
+            )
+            return port
         
         self._logger.warning("DeviceDetector", "Timeout waiting for serial port")
         return None
@@ -388,12 +613,51 @@ class DeviceDetector:
             The target port if detected within timeout, else None.
         """
         timeout = timeout or CONFIG.SERIAL_RECONNECT_TIMEOUT
-        start = time.time()
-        while (time.time() - start) < timeout:
-            for port in serial.tools.list_ports.comports():
-                if port.device == target_port and port.vid == CONFIG.RP2040_USB_VID:
-                    self._logger.info("DeviceDetector", f"Serial port reappeared: {target_port}")
-                    return target_port
-            time.sleep(0.1)
+        if self._await_serial_port(lambda path: path == target_port, timeout):
+            self._logger.info("DeviceDetector", f"Serial port reappeared: {target_port}")
+            return target_port
         self._logger.warning("DeviceDetector", f"Timeout waiting for serial port reappearance: {target_port}")
-        return None
\ No newline at end of file
+        return None
+
+    def _await_serial_port(self, accept: Callable[[str], bool], timeout: float) -> Optional[str]:
+        """
+        Wait for an RP2040 serial port whose path satisfies `accept`.
+
+        While the monitor thread runs, block on its scan results (it scans at
+        DEVICE_WAIT_SCAN_INTERVAL_MS while waiters exist) instead of
+        enumerating ports separately. Detectors that were never started fall
+        back to polling list_ports directly.
+
+        Returns:
+            Matching port path or None on timeout
+        """
+        deadline = time.time() + timeout
+
+        if not self._running:
+            while time.time() < deadline:
+                for port in serial.tools.list_ports.comports():
+                    if port.vid == CONFIG.RP2040_USB_VID and accept(port.device):
+                        return port.device
+                time.sleep(0.1)
+            return None
+
+        with self._scan_cond:
+            self._waiters += 1
+            # Results of scans already under way may predate the call
+            fresh_after = self._scans_started
+        # Rescan now rather than after the current (possibly backed-off) sleep
+        self._wake_event.set()
+        try:
+            with self._scan_cond:
+                while True:
+                    if self._scan_published > fresh_after:
+                        for dev in self._devices.values():
+                            if dev.state == DeviceState.SERIAL and accept(dev.path):
+                                return dev.path
+                    remaining = deadline - time.time()
+                    if remaining <= 0 or not self._running:
+                        return None
+                    self._scan_cond.wait(remaining)
+        finally:
+            with self._scan_cond:
+                self._waiters -= 1
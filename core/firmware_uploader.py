@@ -3,12 +3,20 @@ Firmware upload module using picotool.
 
 Handles firmware upload to RP2040 devices using the picotool command.
 """
-import subprocess
+import asyncio
+import hashlib
 import os
+import re
+import shutil
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
-from pathlib import Path
-from typing import Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from config.settings import CONFIG
 from utils.logger import get_logger
@@ -24,9 +32,13 @@ class UploadStatus(Enum):
     INVALID_FIRMWARE = "invalid_firmware"
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class UploadResult:
-    """Result of firmware upload operation."""
+    """Result of firmware upload operation (immutable, so safe to share)."""
     status: UploadStatus
     message: str
     exit_code: int = 0
@@ -38,6 +50,137 @@ class UploadResult:
         return self.status == UploadStatus.SUCCESS
 
 
+# Keep picotool from allocating a console window per spawn on Windows
+_SPAWN_KWARGS = (
+    {'creationflags': subprocess.CREATE_NO_WINDOW} if sys.platform == "win32" else {}
+)
+
+
+# Platform default picotool location; fixed for the lifetime of the process
+_DEFAULT_PICOTOOL_PATH = CONFIG.get_picotool_path()
+
+# Accepted firmware extensions, lowercased for O(1) lookup
+_FW_EXT_SET = frozenset(e.lower() for e in CONFIG.FIRMWARE_EXTENSIONS)
+
+# Leading bytes expected per firmware format
+_FW_MAGIC = {
+    '.uf2': struct.pack('<II', 0x0A324655, 0x9E5D5157),  # UF2 magic start 0/1
+    '.elf': b'\x7fELF',
+    '.hex': b':',  # Intel HEX record start
+}
+
+# picotool error triage: group name -> (pattern, status, message)
+_ERROR_RULES = {
+    'no_device': (
+        r"No accessible RP(?:2040|-series) devices?",
+        UploadStatus.NO_DEVICE,
+        "No RP2040 device found in BOOTSEL mode",
+    ),
+    'no_access': (
+        r"unable to connect|LIBUSB_ERROR_ACCESS|permission denied",
+        UploadStatus.FAILED,
+        "Upload failed: USB access denied (check permissions / driver)",
+    ),
+}
+# Single-pass scan over stderr; the first matching group decides
+_ERROR_RE = re.compile(
+    "|".join(f"(?P<{name}>{rule[0]})" for name, rule in _ERROR_RULES.items()),
+    re.IGNORECASE
+)
+
+
+def _classify_error(error_msg: str) -> Tuple[UploadStatus, str]:
+    """Map picotool error output to an UploadStatus and message."""
+    match = _ERROR_RE.search(error_msg)
+    if match:
+        _, status, message = _ERROR_RULES[match.lastgroup]
+        return status, message
+    return UploadStatus.FAILED, f"Upload failed: {error_msg}"
+
+
+async def _pump_lines(
+    stream: asyncio.StreamReader,
+    sink: List[str],
+    on_line: Callable[[str], None]
+) -> None:
+    """Collect a subprocess stream line by line, reporting each line."""
+    while True:
+        raw = await stream.readline()
+        if not raw:
+            break
+        line = raw.decode(errors='replace')
+        sink.append(line)
+        on_line(line.rstrip())
+
+
+@lru_cache(maxsize=64)
+def _verify_firmware_cached(
+    firmware_path: str,
+    mtime_ns: int,
+    size: int
+) -> Tuple[UploadStatus, str]:
+    """
+    Validate a firmware file's extension, size and signature.
+    
+    The stat fields are part of the cache key, so an edited file misses.
+    
+    Returns:
+        Tuple of (SUCCESS or failure status, message)
+    """
+    def read_header(n: int) -> bytes:
+        with open(firmware_path, 'rb') as f:
+            return f.read(n)
+    
+    name = os.path.basename(firmware_path)
+    return _check_firmware(name, os.path.splitext(name)[1], size, read_header)
+
+
+def _check_firmware(
+    name: str,
+    ext: str,
+    size: int,
+    read_header: Callable[[int], bytes]
+) -> Tuple[UploadStatus, str]:
+    """
+    Validate firmware extension, size and leading signature bytes.
+    
+    Args:
+        name: Display name for messages
+        ext: File extension including the dot
+        size: Image size in bytes
+        read_header: Returns the first n bytes of the image (may raise OSError)
+    
+    Returns:
+        Tuple of (SUCCESS or failure status, message)
+    """
+    if ext not in _FW_EXT_SET:
+        ext = ext.lower()
+        if ext not in _FW_EXT_SET:
+            valid_exts = ", ".join(CONFIG.FIRMWARE_EXTENSIONS)
+            return (
+                UploadStatus.FIRMWARE_NOT_FOUND,
+                f"Invalid firmware extension '{ext}'. Expected: {valid_exts}"
+            )
+    
+    # Check file size (should be reasonable for RP2040)
+    if size < 100:
+        return UploadStatus.FIRMWARE_NOT_FOUND, f"Firmware file too small ({size} bytes)"
+    if size > 16 * 1024 * 1024:  # 16MB max
+        return UploadStatus.FIRMWARE_NOT_FOUND, f"Firmware file too large ({size} bytes)"
+    
+    # Reject files with the wrong signature before spawning picotool
+    magic = _FW_MAGIC.get(ext)
+    if magic:
+        try:
+            header = read_header(len(magic))
+        except OSError as e:
+            return UploadStatus.FIRMWARE_NOT_FOUND, f"Cannot read firmware file: {e}"
+        if header != magic:
+            return UploadStatus.INVALID_FIRMWARE, f"Not a valid {ext[1:].upper()} file: {name}"
+    
+    return UploadStatus.SUCCESS, f"Firmware valid: {name} ({size} bytes)"
+
+
 class FirmwareUploader:
     """
     Handles firmware upload to RP2040 using picotool.
@@ -55,10 +198,20 @@ class FirmwareUploader:
         # Allow older call style FirmwareUploader(logger)
         if picotool_path is not None and not isinstance(picotool_path, str):
             self._logger = picotool_path  # type: ignore[assignment]
-            self._picotool_path = CONFIG.get_picotool_path()
+            raw_path = _DEFAULT_PICOTOOL_PATH
         else:
             self._logger = get_logger()
-            self._picotool_path = (picotool_path or CONFIG.get_picotool_path())  # type: ignore[assignment]
+            raw_path = (picotool_path or _DEFAULT_PICOTOOL_PATH)  # type: ignore[assignment]
+        
+        # picotool probes, valid until the path changes or invalidate_cache()
+        self._picotool_exists_cached: Optional[bool] = None
+        self._picotool_version_cached: Optional[str] = None
+        self._picotool_missing_result: Optional[UploadResult] = None
+        self._picotool_path = self._resolve_picotool(raw_path)
+        
+        # Temp files backing upload_bytes, keyed by (ext, blob digest)
+        self._blob_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._blob_files: Dict[Tuple[str, bytes], str] = {}
     
     @property
     def picotool_path(self) -> str:
@@ -68,7 +221,28 @@ class FirmwareUploader:
     @picotool_path.setter
     def picotool_path(self, path: str) -> None:
         """Set picotool path."""
-        self._picotool_path = path
+        self._picotool_path = self._resolve_picotool(path)
+    
+    def invalidate_cache(self) -> None:
+        """Forget cached picotool probes (e.g. after the binary is updated)."""
+        self._picotool_exists_cached = None
+        self._picotool_version_cached = None
+        self._picotool_missing_result = None
+    
+    def _resolve_picotool(self, raw_path: str) -> str:
+        """
+        Resolve picotool to an absolute path and probe it once.
+        
+        Bare names are looked up on PATH; unresolvable paths are kept as
+        given so error messages show what was configured.
+        """
+        self.invalidate_cache()
+        resolved = shutil.which(raw_path) or raw_path
+        try:
+            self._picotool_exists_cached = stat.S_ISREG(os.stat(resolved).st_mode)
+        except OSError:
+            self._picotool_exists_cached = False
+        return resolved
     
     def verify_picotool(self) -> Tuple[bool, str]:
         """
@@ -77,24 +251,30 @@ class FirmwareUploader:
         Returns:
             Tuple of (success, message)
         """
+        return asyncio.run(self.verify_picotool_async())
+    
+    async def verify_picotool_async(self) -> Tuple[bool, str]:
+        """Async variant of verify_picotool."""
         if not self._picotool_exists():
             return False, f"picotool not found at: {self._picotool_path}"
         
+        if self._picotool_version_cached is not None:
+            return True, f"picotool found: {self._picotool_version_cached}"
+        
         try:
-            result = subprocess.run(
+            returncode, stdout, stderr = await self._run_picotool(
                 [self._picotool_path, "version"],
-                capture_output=True,
-                text=True,
                 timeout=5
             )
             
-            if result.returncode == 0:
-                version = result.stdout.strip()
+            if returncode == 0:
+                version = stdout.decode(errors='replace').strip()
+                self._picotool_version_cached = version
                 return True, f"picotool found: {version}"
             else:
-                return False, f"picotool error: {result.stderr}"
+                return False, f"picotool error: {stderr.decode(errors='replace')}"
         
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return False, "picotool timed out"
         except Exception as e:
             return False, f"Error running picotool: {e}"
@@ -103,41 +283,62 @@ class FirmwareUploader:
         """
         Verify firmware file exists and has valid extension.
         
+        Results are cached per (path, mtime, size), so re-flashing the same
+        image costs a single stat call.
+        
         Args:
             firmware_path: Path to firmware file
         
         Returns:
             Tuple of (valid, message)
         """
-        path = Path(firmware_path)
-        
-        if not path.exists():
-            return False, f"Firmware file not found: {firmware_path}"
+        status, msg = self._verify_firmware_status(firmware_path)
+        return status is UploadStatus.SUCCESS, msg
+    
+    def _verify_firmware_status(self, firmware_path: str) -> Tuple[UploadStatus, str]:
+        """verify_firmware body, returning the failure status for upload results."""
+        try:
+            st = os.stat(firmware_path)
+        except OSError:
+            return UploadStatus.FIRMWARE_NOT_FOUND, f"Firmware file not found: {firmware_path}"
         
-        if not path.is_file():
-            return False, f"Not a file: {firmware_path}"
+        if not stat.S_ISREG(st.st_mode):
+            return UploadStatus.FIRMWARE_NOT_FOUND, f"Not a file: {firmware_path}"
         
-        ext = path.suffix.lower()
-        if ext not in CONFIG.FIRMWARE_EXTENSIONS:
-            valid_exts = ", ".join(CONFIG.FIRMWARE_EXTENSIONS)
-            return False, f"Invalid firmware extension '{ext}'. Expected: {valid_exts}"
+        return _verify_firmware_cached(firmware_path, st.st_mtime_ns, st.st_size)
+    
+    def upload(
+        self,
+        firmware_path: str,
+        device_path: Optional[str] = None,
+        on_output: Optional[Callable[[str], None]] = None
+    ) -> UploadResult:
+        """
+        Upload firmware to RP2040 device.
         
-        # Check file size (should be reasonable for RP2040)
-        size = path.stat().st_size
-        if size < 100:
-            return False, f"Firmware file too small ({size} bytes)"
-        if size > 16 * 1024 * 1024:  # 16MB max
-            return False, f"Firmware file too large ({size} bytes)"
+        Args:
+            firmware_path: Path to firmware file (ELF, HEX, or UF2)
+            device_path: Optional device path (ignored; for compatibility)
+            on_output: Optional callback for each picotool output line, as it arrives
         
-        return True, f"Firmware valid: {path.name} ({size} bytes)"
+        Returns:
+            UploadResult with status and details
+        """
+        return asyncio.run(self.upload_async(firmware_path, device_path, on_output))
     
-    def upload(self, firmware_path: str, device_path: Optional[str] = None) -> UploadResult:
+    async def upload_async(
+        self,
+        firmware_path: str,
+        device_path: Optional[str] = None,
+        on_output: Optional[Callable[[str], None]] = None
+    ) -> UploadResult:
         """
-        Upload firmware to RP2040 device.
+        Upload firmware without blocking the event loop.
         
         Args:
             firmware_path: Path to firmware file (ELF, HEX, or UF2)
             device_path: Optional device path (ignored; for compatibility)
+            on_output: Optional callback for each picotool output line, as it arrives
         
         Returns:
             UploadResult with status and details
@@ -146,70 +347,71 @@ class FirmwareUploader:
         
         # Verify picotool
         if not self._picotool_exists():
-            msg = f"picotool not found at: {self._picotool_path}"
-            self._logger.error("FirmwareUploader", msg)
-            return UploadResult(
-                status=UploadStatus.PICOTOOL_NOT_FOUND,
-                message=msg
-            )
+            return self._picotool_missing()
         
         # Verify firmware
-        valid, msg = self.verify_firmware(firmware_path)
-        if not valid:
+        status, msg = self._verify_firmware_status(firmware_path)
+        if status is not UploadStatus.SUCCESS:
             self._logger.error("FirmwareUploader", msg)
             return UploadResult(
-                status=UploadStatus.FIRMWARE_NOT_FOUND,
+                status=status,
                 message=msg
             )
         
+        return await self._load_async(firmware_path, on_output)
+    
+    async def _load_async(
+        self,
+        firmware_path: str,
+        on_output: Optional[Callable[[str], None]] = None,
+        device_args: Optional[List[str]] = None
+    ) -> UploadResult:
+        """Run `picotool load` for an already validated firmware file."""
         # Build command
         cmd = [self._picotool_path, "load", firmware_path] + CONFIG.PICOTOOL_LOAD_ARGS
-        self._logger.info("FirmwareUploader", f"Command: {' '.join(cmd)}")
+        if device_args:
+            cmd += device_args
+        self._logger.info("FirmwareUploader", "Command: %s", " ".join(cmd))
         
         try:
             # Run picotool
-            result = subprocess.run(
+            def on_line(line: str) -> None:
+                self._logger.debug("FirmwareUploader", "picotool: %s", line)
+                if on_output:
+                    on_output(line)
+            
+            returncode, stdout, stderr = await self._stream_picotool(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=60  # 60 second timeout for upload
+                timeout=60,  # 60 second timeout for upload
+                on_line=on_line
             )
             
-            self._logger.debug("FirmwareUploader", f"Exit code: {result.returncode}")
-            self._logger.debug("FirmwareUploader", f"stdout: {result.stdout}")
-            if result.stderr:
-                self._logger.debug("FirmwareUploader", f"stderr: {result.stderr}")
+            self._logger.debug("FirmwareUploader", "Exit code: %d", returncode)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 self._logger.success("FirmwareUploader", "Firmware uploaded successfully")
                 return UploadResult(
                     status=UploadStatus.SUCCESS,
                     message="Firmware uploaded successfully",
-                    exit_code=result.returncode,
-                    stdout=result.stdout,
-                    stderr=result.stderr
+                    exit_code=returncode,
+                    stdout=stdout,
+                    stderr=stderr
                 )
             else:
                 # Check for common errors
-                error_msg = result.stderr or result.stdout
-                
-                if "No accessible RP2040" in error_msg:
-                    status = UploadStatus.NO_DEVICE
-                    msg = "No RP2040 device found in BOOTSEL mode"
-                else:
-                    status = UploadStatus.FAILED
-                    msg = f"Upload failed: {error_msg}"
+                error_msg = stderr or stdout
+                status, msg = _classify_error(error_msg)
                 
                 self._logger.error("FirmwareUploader", msg)
                 return UploadResult(
                     status=status,
                     message=msg,
-                    exit_code=result.returncode,
-                    stdout=result.stdout,
-                    stderr=result.stderr
+                    exit_code=returncode,
+                    stdout=stdout,
+                    stderr=stderr
                 )
         
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             msg = "Firmware upload timed out (60s)"
             self._logger.error("FirmwareUploader", msg)
             return UploadResult(
@@ -225,6 +427,173 @@ class FirmwareUploader:
                 message=msg
             )
     
+    def upload_bytes(
+        self,
+        firmware_blob: bytes,
+        ext: str,
+        device_serial: Optional[str] = None,
+        on_output: Optional[Callable[[str], None]] = None
+    ) -> UploadResult:
+        """
+        Upload a firmware image already held in memory.
+        
+        Each distinct image is validated and written to a temp file once;
+        later calls with the same bytes reuse that file, so a batch driver
+        can read the firmware once and flash it onto many boards.
+        
+        Args:
+            firmware_blob: Firmware image contents
+            ext: Firmware format extension (".uf2", ".elf" or ".hex")
+            device_serial: Optional USB serial to select the device (--ser)
+            on_output: Optional callback for each picotool output line
+        
+        Returns:
+            UploadResult with status and details
+        """
+        return asyncio.run(
+            self.upload_bytes_async(firmware_blob, ext, device_serial, on_output)
+        )
+    
+    async def upload_bytes_async(
+        self,
+        firmware_blob: bytes,
+        ext: str,
+        device_serial: Optional[str] = None,
+        on_output: Optional[Callable[[str], None]] = None
+    ) -> UploadResult:
+        """Async variant of upload_bytes."""
+        if not self._picotool_exists():
+            return self._picotool_missing()
+        
+        key = (ext.lower(), hashlib.blake2b(firmware_blob, digest_size=16).digest())
+        firmware_path = self._blob_files.get(key)
+        if firmware_path is None:
+            status, msg = _check_firmware(
+                f"<memory{key[0]}>", key[0], len(firmware_blob),
+                lambda n: firmware_blob[:n]
+            )
+            if status is not UploadStatus.SUCCESS:
+                self._logger.error("FirmwareUploader", msg)
+                return UploadResult(status=status, message=msg)
+            try:
+                firmware_path = self._write_blob(firmware_blob, key)
+            except OSError as e:
+                msg = f"Failed to stage firmware image: {e}"
+                self._logger.error("FirmwareUploader", msg)
+                return UploadResult(status=UploadStatus.FAILED, message=msg)
+        
+        self._logger.info("FirmwareUploader", f"Starting upload: {firmware_path}")
+        device_args = ["--ser", device_serial] if device_serial else None
+        return await self._load_async(firmware_path, on_output, device_args)
+    
+    def _write_blob(self, firmware_blob: bytes, key: Tuple[str, bytes]) -> str:
+        """Write a validated image to the uploader's temp dir and remember it."""
+        if self._blob_dir is None:
+            # Removed automatically when the uploader is collected or at exit
+            self._blob_dir = tempfile.TemporaryDirectory(prefix="rp2040_fw_")
+        path = os.path.join(self._blob_dir.name, f"{key[1].hex()}{key[0]}")
+        with open(path, 'wb') as f:
+            f.write(firmware_blob)
+        self._blob_files[key] = path
+        return path
+    
+    async def flash_many(
+        self,
+        firmware_path: str,
+        device_serials: List[str],
+        max_parallel: int = 4
+    ) -> List[UploadResult]:
+        """
+        Flash one firmware image onto several BOOTSEL devices in parallel.
+        
+        Each load selects its board with picotool's `--ser` option; the
+        semaphore bounds how many loads share the USB bus at once.
+        
+        Args:
+            firmware_path: Path to firmware file
+            device_serials: USB serial numbers of the target devices
+            max_parallel: Maximum concurrent picotool loads
+        
+        Returns:
+            UploadResults in device order
+        """
+        if not self._picotool_exists():
+            return [self._picotool_missing()] * len(device_serials)
+        
+        status, msg = self._verify_firmware_status(firmware_path)
+        if status is not UploadStatus.SUCCESS:
+            self._logger.error("FirmwareUploader", msg)
+            return [UploadResult(status=status, message=msg)] * len(device_serials)
+        
+        sem = asyncio.Semaphore(max(1, max_parallel))
+        
+        async def flash_one(serial_number: str) -> UploadResult:
+            async with sem:
+                self._logger.info(
+                    "FirmwareUploader",
+                    f"Starting upload: {firmware_path} -> {serial_number}"
+                )
+                return await self._load_async(
+                    firmware_path,
+                    device_args=["--ser", serial_number]
+                )
+        
+        results = await asyncio.gather(
+            *(flash_one(sn) for sn in device_serials),
+            return_exceptions=True
+        )
+        return [
+            r if isinstance(r, UploadResult) else UploadResult(
+                status=UploadStatus.FAILED,
+                message=f"Error during upload: {r}"
+            )
+            for r in results
+        ]
+    
+    def begin_batch(self) -> Tuple[bool, str]:
+        """
+        Prime picotool checks ahead of a batch of uploads.
+        
+        Returns:
+            Tuple of (success, message) from verify_picotool
+        """
+        return self.verify_picotool()
+    
+    def upload_batch(self, firmware_paths: List[str]) -> List[UploadResult]:
+        """
+        Upload firmware files back-to-back with a single pre-flight check.
+        
+        picotool and each distinct firmware file are validated once; the
+        loads then run in order without the per-upload checks.
+        
+        Args:
+            firmware_paths: Firmware files to load, in order
+        
+        Returns:
+            UploadResults in input order
+        """
+        return asyncio.run(self._upload_batch_async(firmware_paths))
+    
+    async def _upload_batch_async(self, firmware_paths: List[str]) -> List[UploadResult]:
+        """Async body of upload_batch."""
+        if not self._picotool_exists():
+            return [self._picotool_missing()] * len(firmware_paths)
+        
+        checks = {path: self._verify_firmware_status(path) for path in set(firmware_paths)}
+        results: List[UploadResult] = []
+        for firmware_path in firmware_paths:
+            status, msg = checks[firmware_path]
+            if status is not UploadStatus.SUCCESS:
+                self._logger.error("FirmwareUploader", msg)
+                results.append(UploadResult(
+                    status=status,
+                    message=msg
+                ))
+                continue
+            self._logger.info("FirmwareUploader", f"Starting upload: {firmware_path}")
+            results.append(await self._load_async(firmware_path))
+        return results
+    
     def get_device_info(self) -> Optional[dict]:
         """
         Get information about connected RP2040 device using picotool.
@@ -232,22 +601,25 @@ class FirmwareUploader:
         Returns:
             Device info dict or None if not available
         """
+        return asyncio.run(self.get_device_info_async())
+    
+    async def get_device_info_async(self) -> Optional[dict]:
+        """Async variant of get_device_info."""
         if not self._picotool_exists():
             return None
         
         try:
-            result = subprocess.run(
+            returncode, stdout, _ = await self._run_picotool(
                 [self._picotool_path, "info"],
-                capture_output=True,
-                text=True,
-                timeout=5
+                timeout=5,
+                capture_stderr=False
             )
             
-            if result.returncode == 0:
-                return {"info": result.stdout}
+            if returncode == 0:
+                return {"info": stdout.decode(errors='replace')}
             return None
         
-        except:
+        except (asyncio.TimeoutError, OSError):
             return None
     
     def reboot_device(self) -> bool:
@@ -257,21 +629,140 @@ class FirmwareUploader:
         Returns:
             True if reboot command succeeded
         """
+        return asyncio.run(self.reboot_device_async())
+    
+    async def reboot_device_async(self) -> bool:
+        """Async variant of reboot_device."""
         if not self._picotool_exists():
             return False
         
         try:
-            result = subprocess.run(
+            returncode, _, _ = await self._run_picotool(
                 [self._picotool_path, "reboot"],
-                capture_output=True,
-                text=True,
-                timeout=5
+                timeout=5,
+                capture_stdout=False,
+                capture_stderr=False
             )
-            return result.returncode == 0
-        except:
+            return returncode == 0
+        except (asyncio.TimeoutError, OSError):
             return False
     
+    async def _run_picotool(
+        self,
+        cmd: List[str],
+        timeout: float,
+        capture_stdout: bool = True,
+        capture_stderr: bool = True
+    ) -> Tuple[int, bytes, bytes]:
+        """
+        Run a short picotool command as an asyncio subprocess.
+        
+        Output is returned undecoded; callers decode only what they use.
+        Streams that are not captured go to DEVNULL and come back as b"".
+        
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds before the process is killed
+            capture_stdout: Pipe stdout back to the caller
+            capture_stderr: Pipe stderr back to the caller
+        
+        Returns:
+            Tuple of (exit code, stdout, stderr)
+        
+        Raises:
+            asyncio.TimeoutError: If the command does not finish in time
+        """
+        proc = await self._spawn_picotool(
+            cmd,
+            stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        finally:
+            await self._reap_picotool(proc)
+        return proc.returncode, stdout or b"", stderr or b""
+    
+    async def _stream_picotool(
+        self,
+        cmd: List[str],
+        timeout: float,
+        on_line: Callable[[str], None]
+    ) -> Tuple[int, str, str]:
+        """
+        Run a picotool command, reporting output lines as they arrive.
+        
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds before the process is killed
+            on_line: Callback for each stdout/stderr line
+        
+        Returns:
+            Tuple of (exit code, stdout, stderr)
+        
+        Raises:
+            asyncio.TimeoutError: If the command does not finish in time
+        """
+        proc = await self._spawn_picotool(cmd)
+        out_lines: List[str] = []
+        err_lines: List[str] = []
+        pumps = asyncio.gather(
+            _pump_lines(proc.stdout, out_lines, on_line),
+            _pump_lines(proc.stderr, err_lines, on_line),
+            proc.wait()
+        )
+        try:
+            await asyncio.wait_for(pumps, timeout=timeout)
+        finally:
+            await self._reap_picotool(proc)
+            if not pumps.done():
+                pumps.cancel()
+            # The error (if any) is already propagating; mark it retrieved
+            pumps.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return proc.returncode, "".join(out_lines), "".join(err_lines)
+    
+    async def _reap_picotool(self, proc: asyncio.subprocess.Process) -> None:
+        """
+        Kill picotool if it is still running and wait for it to exit.
+        
+        Called on every exit path (timeout, callback error, cancellation) so
+        an interrupted command never leaves picotool running mid-load.
+        """
+        if proc.returncode is not None:
+            return
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass  # Exited between the check and the kill
+        await proc.wait()
+    
+    async def _spawn_picotool(
+        self,
+        cmd: List[str],
+        stdout: int = asyncio.subprocess.PIPE,
+        stderr: int = asyncio.subprocess.PIPE
+    ) -> asyncio.subprocess.Process:
+        """Start picotool with the given output redirection."""
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=stdout,
+            stderr=stderr,
+            **_SPAWN_KWARGS
+        )
+    
+    def _picotool_missing(self) -> UploadResult:
+        """Log and return the shared PICOTOOL_NOT_FOUND result for this path."""
+        result = self._picotool_missing_result
+        if result is None:
+            result = self._picotool_missing_result = UploadResult(
+                status=UploadStatus.PICOTOOL_NOT_FOUND,
+                message=f"picotool not found at: {self._picotool_path}"
+            )
+        self._logger.error("FirmwareUploader", result.message)
+        return result
+    
     def _picotool_exists(self) -> bool:
-        """Check if picotool executable exists."""
-        path = Path(self._picotool_path)
-        return path.exists() and path.is_file()
\ No newline at end of file
+        """Check if picotool executable exists (cached per path)."""
+        if self._picotool_exists_cached is None:
+            self._resolve_picotool(self._picotool_path)
+        return bool(self._picotool_exists_cached)
\ No newline at end of file
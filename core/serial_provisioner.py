@@ -3,21 +3,132 @@ Serial provisioning module for ENERGIS PDU.
 
 Handles serial communication for device provisioning after firmware upload.
 """
+import os
 import time
 import sys
 import re
+import selectors
 import threading
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, List, Optional
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 
 import serial
 from serial.tools import list_ports
 
 from config.settings import CONFIG
 from utils.logger import get_logger
+from utils.port_cache import invalidate_port_cache
 from core.device_detector import DeviceDetector
 
+# Optional udev monitor to wake port-open retries when permissions settle (Linux)
+try:
+    import pyudev
+    UDEV_AVAILABLE = True
+except ImportError:
+    UDEV_AVAILABLE = False
+
+# Optional log prefix tag such as [ECHO] or [INFO] at the start of a line
+_TAG_RE = re.compile(r"^\[[^\]]+\]\s*")
+# Runs of characters that are collapsed to "_" when normalizing keys
+_KEY_RE = re.compile(r"[^a-z0-9]+")
+# Provisioning commands that are the same for every device, formatted once
+_UNLOCK_COMMAND = f"PROV UNLOCK {CONFIG.PROV_UNLOCK_CODE}"
+_REGION_COMMANDS = {code: f"PROV SET_REGION {code}" for code in CONFIG.REGION_CODES}
+
+# Console echo of an info command, possibly after a tag or prompt ("> NETINFO")
+_INFO_ECHO_RE = re.compile(r"\b(SYSINFO|NETINFO)\s*$")
+
+# Received lines kept for the consumer; oldest idle chatter is dropped first
+_RX_LINES_MAX = 1024
+
+# Success / failure keywords looked for in command responses
+_OK_RE = re.compile(r"OK|SUCCESS", re.IGNORECASE)
+_FAIL_RE = re.compile(r"ERROR|FAIL", re.IGNORECASE)
+# Whole reply lines for pipelined commands: the keyword leads the line,
+# either as its tag ("[OK] ...") or right after an optional log tag, so
+# chatter such as "[INFO] Flash OK" is not taken for a reply
+_OK_REPLY_RE = re.compile(
+    r"(?:\[(?:OK|SUCCESS)\]|(?:\[[^\]]+\]\s*)?(?:OK|SUCCESS)\b)", re.IGNORECASE
+)
+_FAIL_REPLY_RE = re.compile(
+    r"(?:\[(?:ERROR|FAIL\w*)\]|(?:\[[^\]]+\]\s*)?(?:ERROR|FAIL\w*)\b)", re.IGNORECASE
+)
+# Maps every Latin-1 character outside [a-z0-9] to "_" for the fast path
+_KEY_TABLE = str.maketrans({
+    c: "_" for c in map(chr, range(256))
+    if not ("0" <= c <= "9" or "a" <= c <= "z")
+})
+
+
+# Readiness markers folded into one pattern so each raw line is scanned once;
+# the configured marker is exact, the console banner is case-insensitive
+_READY_RE = re.compile(
+    re.escape(CONFIG.SYSTEM_READY_MARKER.encode('utf-8')) + rb"|(?i:CONSOLE READY)"
+)
+
+
+def _is_ready_line(line: bytes) -> bool:
+    """Check a received line for one of the readiness markers."""
+    return _READY_RE.search(line) is not None
+
+
+def _normalize_key(key: str) -> str:
+    """Lowercase a response key and collapse non-alphanumeric runs to '_'."""
+    key = key.strip().lower()
+    if not key.isascii():
+        return _KEY_RE.sub("_", key)
+    key = key.translate(_KEY_TABLE)
+    while "__" in key:
+        key = key.replace("__", "_")
+    return key
+
+
+@lru_cache(maxsize=8)
+def _parse_status_lines(lines: Tuple[str, ...]) -> dict:
+    """
+    Parse PROV STATUS lines into a dict with normalized keys.
+    
+    Memoized because a provisioning run checks the growing response for
+    completeness as it arrives and then parses the final lines once more.
+    The returned dict is shared and must not be modified.
+    """
+    result = {}
+    for line in lines:
+        # Strip optional log prefix tags like [ECHO], [INFO]
+        line = _TAG_RE.sub("", line)
+        key, sep, value = line.partition(':')
+        if sep:
+            # Normalize keys: lowercase and replace non-alnum with underscores
+            result[_normalize_key(key)] = value.strip()
+    _apply_key_aliases(result)
+    return result
+
+
+def _apply_key_aliases(result: dict) -> None:
+    """Fill serial_number/region from their common aliases in place."""
+    # Map common aliases
+    if 'serial_number' not in result:
+        if 'device_serial' in result:
+            result['serial_number'] = result['device_serial']
+        elif 'sn' in result:
+            result['serial_number'] = result['sn']
+        elif 's_n' in result:
+            result['serial_number'] = result['s_n']
+        elif 'serial' in result:
+            result['serial_number'] = result['serial']
+    # Normalize region value to code (EU/US)
+    if 'region' not in result and 'region_code' in result:
+        result['region'] = result['region_code']
+    if 'region' in result:
+        val = result['region']
+        for code in CONFIG.REGION_CODES:
+            if code in val:
+                result['region'] = code
+                break
+
 
 class ProvisioningStatus(Enum):
     """Provisioning operation status."""
@@ -55,18 +166,38 @@ class SerialProvisioner:
     Manages connection, command sending, and response parsing.
     """
     
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, detector: Optional[DeviceDetector] = None):
         # Allow older call style SerialProvisioner(logger)
         self._logger = logger if logger is not None else get_logger()
         self._serial: Optional[serial.Serial] = None
         self._port: Optional[str] = None
         self._lock = threading.Lock()
         self._rx_buffer: List[str] = []
+        # Raw bytes received but not yet split into complete lines
+        self._rx_bytes = bytearray()
+        # Set when a readiness banner was drained ahead of a command
+        self._ready_seen = False
+        # Tracked here so hot loops don't query pyserial's is_open property
+        self._is_open = False
+        # Background reader: fills _rx_lines with (seq, line); commands consume
+        self._reader: Optional[threading.Thread] = None
+        # Selector and wake pipe the reader blocks on (POSIX only)
+        self._reader_selector: Optional[selectors.BaseSelector] = None
+        self._reader_wake: Optional[Tuple[int, int]] = None
+        # Lines stay bytes until they reach a caller or the serial log
+        self._rx_lines: deque = deque(maxlen=_RX_LINES_MAX)
+        self._rx_seq = 0
+        self._rx_event = threading.Event()
+        self._rx_error: Optional[serial.SerialException] = None
+        # Reused command buffer; grown only for unusually long commands
+        self._tx = bytearray(128)
+        # Shared detector (e.g. the GUI's running one), else created on first reboot
+        self._detector = detector
     
     @property
     def is_connected(self) -> bool:
         """Check if serial connection is active."""
-        return self._serial is not None and self._serial.is_open
+        return self._is_open
     
     @property
     def port(self) -> Optional[str]:
@@ -93,11 +224,18 @@ class SerialProvisioner:
             self._serial = serial.Serial(
                 port=port,
                 baudrate=CONFIG.SERIAL_BAUDRATE,
-                timeout=CONFIG.SERIAL_TIMEOUT,
+                timeout=CONFIG.SERIAL_READ_SLICE,
                 write_timeout=CONFIG.SERIAL_WRITE_TIMEOUT
             )
             self._port = port
             self._rx_buffer.clear()
+            self._rx_bytes.clear()
+            self._ready_seen = False
+            self._rx_lines.clear()
+            self._rx_error = None
+            self._is_open = self._serial.is_open
+            self._start_reader()
+            invalidate_port_cache()
             
             # Small delay for connection stabilization
             time.sleep(0.1)
@@ -113,15 +251,97 @@ class SerialProvisioner:
             self._port = None
             return False
     
+    def _connect_with_retry(
+        self,
+        port: str,
+        attempts: int,
+        interval: float,
+        silence: bool = False
+    ) -> Optional[int]:
+        """
+        Open a port, retrying while the OS finishes setting it up.
+        
+        Between attempts the wait ends early once udev reports the node as
+        accessible (Linux with pyudev); otherwise it sleeps for the interval.
+        
+        Args:
+            port: Serial port path
+            attempts: Maximum number of open attempts
+            interval: Maximum wait between attempts in seconds
+            silence: When True, keep every attempt silent (not only retries)
+        
+        Returns:
+            Index of the successful attempt, or None if all attempts failed
+        """
+        monitor = None
+        for attempt in range(attempts):
+            if self.connect(port, silence=(silence or attempt > 0)):
+                return attempt
+            if attempt == attempts - 1:
+                break
+            if monitor is None:
+                monitor = self._open_tty_monitor()
+            self._wait_for_port_ready(port, interval, monitor)
+        return None
+    
+    def _open_tty_monitor(self):
+        """Start a udev monitor for tty events, or return None if unavailable."""
+        if not (UDEV_AVAILABLE and sys.platform.startswith('linux')):
+            return None
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('tty')
+            monitor.start()
+            return monitor
+        except (ImportError, OSError):
+            # libudev missing or netlink not permitted
+            return None
+    
+    def _wait_for_port_ready(self, port: str, timeout: float, monitor) -> None:
+        """
+        Wait up to timeout for a port node to appear with usable permissions.
+        
+        Args:
+            port: Serial port path
+            timeout: Maximum wait in seconds
+            monitor: Started udev monitor, or None to simply sleep
+        """
+        # Without a monitor, or when the node is already accessible and the
+        # open failed for another reason, there is no event to wait for
+        if monitor is None or os.access(port, os.R_OK | os.W_OK):
+            time.sleep(timeout)
+            return
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            device = monitor.poll(timeout=remaining)
+            if device is None:
+                return
+            if device.device_node == port and os.access(port, os.R_OK | os.W_OK):
+                return
+    
     def disconnect(self) -> None:
         """Disconnect from serial port."""
+        self._is_open = False
+        self._wake_reader()
+        reader = self._reader
+        self._reader = None
+        if reader is not None and reader is not threading.current_thread():
+            # Reader exits once woken (or after one read slice) and sees the flag
+            reader.join(timeout=1.0)
+            if not reader.is_alive():
+                self._close_reader_selector()
         if self._serial:
             try:
                 self._serial.close()
-            except:
+            except (serial.SerialException, OSError):
                 pass
             self._serial = None
             self._port = None
+            invalidate_port_cache()
+        _parse_status_lines.cache_clear()
     
     def reconnect(self, max_retries: int = None, silence: bool = True) -> bool:
         """
@@ -162,7 +382,9 @@ class SerialProvisioner:
         self,
         command: str,
         timeout: float = None,
-        expect_response: bool = True
+        expect_response: bool = True,
+        done: Optional[Callable[[List[str]], bool]] = None,
+        flush: bool = False
     ) -> Optional[List[str]]:
         """
         Send command and optionally wait for response.
@@ -171,10 +393,73 @@ class SerialProvisioner:
             command: Command string to send
             timeout: Response timeout in seconds
             expect_response: Whether to wait for response
+            done: Optional predicate on the lines so far; the read returns
+                as soon as it is true instead of waiting for silence
+            flush: Block until the bytes are physically sent; only needed
+                for commands after which the device drops the port
         
         Returns:
             List of response lines or None on error
         """
+        return self._exchange([command], timeout, expect_response, done, flush)
+    
+    def send_pipeline(
+        self,
+        commands: List[str],
+        timeout: float = None
+    ) -> Optional[Tuple[int, bool]]:
+        """
+        Send several commands in one write and read their replies together.
+        
+        Replies are matched to commands by counting lines that start with
+        OK in order, so this is only suitable for commands that each answer
+        OK or ERROR.
+        
+        Args:
+            commands: Command strings to send, in order
+            timeout: Response timeout in seconds (silence between lines)
+        
+        Returns:
+            Tuple of (acknowledged, failed): the number of commands that
+            answered OK and whether the next one reported an error (or
+            nothing came back at all), or None on error. acknowledged may
+            fall short without failed being set when the device did not
+            answer every command explicitly.
+        """
+        sent = {command.strip() for command in commands}
+        progress = [0, False]
+        
+        def done(lines: List[str]) -> bool:
+            acknowledged = 0
+            for line in lines:
+                if _TAG_RE.sub("", line) in sent:
+                    # Echo of one of our commands, not a reply
+                    continue
+                if _OK_REPLY_RE.match(line):
+                    acknowledged += 1
+                elif _FAIL_REPLY_RE.match(line):
+                    progress[:] = [acknowledged, True]
+                    return True
+            progress[:] = [acknowledged, False]
+            return acknowledged >= len(commands)
+        
+        response = self._exchange(commands, timeout, True, done, False)
+        if response is None:
+            return None
+        if not response:
+            # Silence counts as failure, as in _check_response_ok
+            return 0, True
+        return progress[0], progress[1]
+    
+    def _exchange(
+        self,
+        commands: List[str],
+        timeout: Optional[float],
+        expect_response: bool,
+        done: Optional[Callable[[List[str]], bool]],
+        flush: bool
+    ) -> Optional[List[str]]:
+        """Write commands in a single transfer and read the combined response."""
         if not self.is_connected:
             self._logger.error("SerialProvisioner", "Not connected")
             return None
@@ -183,43 +468,227 @@ class SerialProvisioner:
         
         with self._lock:
             try:
-                # Clear input buffer
-                self._serial.reset_input_buffer()
+                # Consume anything left over without discarding banners
+                mark = self._rx_seq
+                self._drain(mark)
                 
-                # Send command
-                cmd_bytes = (command.strip() + "\r\n").encode('utf-8')
-                self._logger.log_serial_tx(command.strip())
-                self._serial.write(cmd_bytes)
-                self._serial.flush()
+                # Send commands, each CRLF terminated
+                end = 0
+                for command in commands:
+                    text = command.strip()
+                    data = text.encode('utf-8')
+                    size = len(data)
+                    if end + size + 2 > len(self._tx):
+                        grown = bytearray(max(2 * len(self._tx), end + size + 2))
+                        grown[:end] = self._tx[:end]
+                        self._tx = grown
+                    tx = self._tx
+                    tx[end:end + size] = data
+                    tx[end + size:end + size + 2] = b"\r\n"
+                    end += size + 2
+                    self._logger.log_serial_tx(text)
+                self._serial.write(memoryview(self._tx)[:end])
+                if flush:
+                    self._serial.flush()
                 
                 if not expect_response:
                     return []
                 
                 # Read response
-                return self._read_response(timeout)
+                return self._read_response(timeout, mark, done)
             
             except serial.SerialException as e:
+                self._is_open = False
+                self._wake_reader()
                 self._logger.error("SerialProvisioner", f"Serial error: {e}")
                 return None
     
-    def _read_response(self, timeout: float) -> List[str]:
-        """Read response lines until timeout or empty line."""
+    def _start_reader(self) -> None:
+        """Start the background thread that reads the port into _rx_lines."""
+        selector = self._open_reader_selector(self._serial)
+        self._reader = threading.Thread(
+            target=self._reader_loop,
+            args=(self._serial, selector),
+            name="serial-reader",
+            daemon=True
+        )
+        self._reader.start()
+    
+    def _open_reader_selector(self, ser: serial.Serial) -> Optional[selectors.BaseSelector]:
+        """
+        Register the port and a wake pipe with a selector.
+        
+        Returns None when the port has no selectable handle (Windows), in
+        which case the reader falls back to timed reads.
+        """
+        self._close_reader_selector()
+        if os.name == "nt":
+            return None
+        try:
+            fd = ser.fileno()
+        except (AttributeError, OSError, serial.SerialException):
+            return None
+        selector = selectors.DefaultSelector()
+        wake_r, wake_w = os.pipe()
+        selector.register(fd, selectors.EVENT_READ)
+        selector.register(wake_r, selectors.EVENT_READ)
+        self._reader_selector = selector
+        self._reader_wake = (wake_r, wake_w)
+        return selector
+    
+    def _wake_reader(self) -> None:
+        """Interrupt a reader blocked in select so it notices a disconnect."""
+        if self._reader_wake is not None:
+            try:
+                os.write(self._reader_wake[1], b"\0")
+            except OSError:
+                pass
+    
+    def _close_reader_selector(self) -> None:
+        """Release the reader selector and wake pipe once the reader is gone."""
+        if self._reader_selector is not None:
+            self._reader_selector.close()
+            self._reader_selector = None
+        if self._reader_wake is not None:
+            for fd in self._reader_wake:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._reader_wake = None
+    
+    def _reader_loop(self, ser: serial.Serial, selector: Optional[selectors.BaseSelector]) -> None:
+        """
+        Read the port until disconnected, publishing complete lines.
+        
+        Only this thread appends to _rx_lines and bumps _rx_seq; consumers
+        pop from the other end and wait on _rx_event, so no lock is needed.
+        With a selector the thread sleeps in the kernel until the port is
+        readable or disconnect wakes it; otherwise each read blocks for at
+        most one read slice (the port timeout).
+        """
+        read = ser.read
+        publish = self._rx_lines.append
+        notify = self._rx_event.set
+        while self._is_open and self._serial is ser:
+            try:
+                if selector is not None:
+                    selector.select()
+                    if not (self._is_open and self._serial is ser):
+                        break
+                n = ser.in_waiting
+                data = read(n or 1)
+                if not data:
+                    continue
+                self._rx_bytes += data
+                if not n:
+                    # Woke on the first byte; collect whatever arrived with it
+                    n = ser.in_waiting
+                    if n:
+                        self._rx_bytes += read(n)
+            except (serial.SerialException, OSError) as e:
+                if not isinstance(e, serial.SerialException):
+                    e = serial.SerialException(str(e))
+                self._rx_error = e
+                self._rx_event.set()
+                return
+            
+            lines = self._split_lines()
+            if lines:
+                for line in lines:
+                    self._rx_seq += 1
+                    publish((self._rx_seq, line))
+                notify()
+    
+    def _read_lines(self, timeout: float) -> List[bytes]:
+        """
+        Take all complete lines received so far.
+        
+        Waits up to timeout for the reader when nothing is pending, so callers
+        wake on the first line instead of sleeping.
+        
+        Raises:
+            serial.SerialException: If the reader stopped on a port error
+        """
+        pending = self._rx_lines
+        if not pending:
+            self._rx_event.clear()
+            # Re-check after clearing so a line published in between isn't missed
+            if not pending and self._rx_error is None:
+                self._rx_event.wait(timeout)
+        lines = []
+        while pending:
+            lines.append(pending.popleft()[1])
+        if not lines and self._rx_error is not None:
+            raise self._rx_error
+        return lines
+    
+    def _split_lines(self) -> List[bytes]:
+        """Split complete lines off the receive buffer, keeping any partial tail."""
+        if b"\n" not in self._rx_bytes:
+            return []
+        *complete, rest = self._rx_bytes.split(b"\n")
+        self._rx_bytes = bytearray(rest)
+        lines = []
+        for raw in complete:
+            line = bytes(raw.strip())
+            if line:
+                lines.append(line)
+        return lines
+    
+    def _drain(self, mark: int) -> None:
+        """
+        Consume lines received up to sequence number mark without blocking.
+        
+        Stale lines are logged rather than silently flushed, and a readiness
+        banner among them is remembered for the next ready check.
+        
+        Raises:
+            serial.SerialException: If the reader stopped on a port error
+        """
+        if self._rx_error is not None:
+            raise self._rx_error
+        pending = self._rx_lines
+        while pending and pending[0][0] <= mark:
+            line = pending.popleft()[1]
+            self._logger.log_serial_rx(line)
+            if _is_ready_line(line):
+                self._ready_seen = True
+    
+    def _read_response(
+        self,
+        timeout: float,
+        mark: int = 0,
+        done: Optional[Callable[[List[str]], bool]] = None
+    ) -> List[str]:
+        """Read response lines until timeout, or until done(lines) is true."""
         lines = []
-        start = time.time()
+        # Locals for the loop below
+        now = time.monotonic
+        read_lines = self._read_lines
+        log_rx = self._logger.log_serial_rx
+        append = lines.append
+        deadline = now() + timeout
         
-        while (time.time() - start) < timeout:
+        while True:
+            remaining = deadline - now()
+            if remaining <= 0:
+                break
             try:
-                if self._serial.in_waiting > 0:
-                    line = self._serial.readline().decode('utf-8', errors='replace').strip()
-                    if line:
-                        self._logger.log_serial_rx(line)
-                        lines.append(line)
-                        # Reset timeout on data received
-                        start = time.time()
-                else:
-                    time.sleep(0.01)
-            except:
+                received = read_lines(remaining)
+            except serial.SerialException:
+                # Reader stopped on a port error; the connection is gone
+                self._is_open = False
                 break
+            for raw in received:
+                line = raw.decode('utf-8', errors='replace')
+                log_rx(line)
+                append(line)
+            if received:
+                if done is not None and done(lines):
+                    break
+                # Reset timeout on data received
+                deadline = now() + timeout
         
         return lines
     
@@ -239,23 +708,17 @@ class SerialProvisioner:
             return False
         
         self._logger.info("SerialProvisioner", "Waiting for SYSTEM READY...")
-        start = time.time()
+        deadline = time.monotonic() + timeout
         
-        while (time.time() - start) < timeout:
+        while time.monotonic() < deadline:
             try:
-                if self._serial.in_waiting > 0:
-                    line = self._serial.readline().decode('utf-8', errors='replace').strip()
-                    if line:
-                        self._logger.log_serial_rx(line)
-                        # Accept multiple readiness markers
-                        if (CONFIG.SYSTEM_READY_MARKER in line) or ("CONSOLE READY" in line.upper()):
-                            self._logger.success(
-                                "SerialProvisioner",
-                                "Device ready"
-                            )
-                            return True
-                else:
-                    time.sleep(0.05)
+                if self._read_until_ready(deadline):
+                    self._logger.success(
+                        "SerialProvisioner",
+                        "Device ready"
+                    )
+                    return True
+                break
             except serial.SerialException:
                 # Port may disconnect during reset
                 time.sleep(0.1)
@@ -278,22 +741,36 @@ class SerialProvisioner:
         """
         if not self.is_connected:
             return False
-        start = time.time()
-        while (time.time() - start) < timeout:
-            try:
-                if self._serial.in_waiting > 0:
-                    line = self._serial.readline().decode('utf-8', errors='replace').strip()
-                    if line:
-                        self._logger.log_serial_rx(line)
-                        if (CONFIG.SYSTEM_READY_MARKER in line) or ("CONSOLE READY" in line.upper()):
-                            if not silence:
-                                self._logger.success("SerialProvisioner", "Device ready")
-                            return True
-                else:
-                    time.sleep(0.02)
-            except serial.SerialException:
-                break
-        return False
+        try:
+            ready = self._read_until_ready(time.monotonic() + timeout)
+        except serial.SerialException:
+            return False
+        if ready and not silence:
+            self._logger.success("SerialProvisioner", "Device ready")
+        return ready
+    
+    def _read_until_ready(self, deadline: float) -> bool:
+        """
+        Read lines until a readiness marker arrives or the deadline passes.
+        
+        Raises:
+            serial.SerialException: If the port fails while reading
+        """
+        if self._ready_seen:
+            self._ready_seen = False
+            return True
+        now = time.monotonic
+        read_lines = self._read_lines
+        log_rx = self._logger.log_serial_rx
+        search = _READY_RE.search
+        while True:
+            remaining = deadline - now()
+            if remaining <= 0:
+                return False
+            for line in read_lines(remaining):
+                log_rx(line)
+                if search(line) is not None:
+                    return True
     
     def provision_device(
         self,
@@ -321,45 +798,52 @@ class SerialProvisioner:
                 message="Not connected to device"
             )
         
-        # Step 1: Unlock provisioning
-        self._logger.info("SerialProvisioner", "Unlocking provisioning mode...")
-        response = self.send_command(f"PROV UNLOCK {CONFIG.PROV_UNLOCK_CODE}")
-        if not self._check_response_ok(response):
-            return ProvisioningResult(
-                status=ProvisioningStatus.COMMAND_ERROR,
-                message="Failed to unlock provisioning mode"
-            )
+        # Steps 1-3: Unlock provisioning, set serial number, set region
+        steps = [
+            (_UNLOCK_COMMAND,
+             "Unlocking provisioning mode...",
+             "Failed to unlock provisioning mode"),
+            (f"PROV SET_SN {serial_number}",
+             f"Setting serial number: {serial_number}",
+             "Failed to set serial number"),
+            (_REGION_COMMANDS.get(region) or f"PROV SET_REGION {region}",
+             f"Setting region: {region}",
+             "Failed to set region"),
+        ]
+        for _, message, _ in steps:
+            self._logger.info("SerialProvisioner", message)
         
-        # Step 2: Set serial number
-        self._logger.info("SerialProvisioner", f"Setting serial number: {serial_number}")
-        response = self.send_command(f"PROV SET_SN {serial_number}")
-        if not self._check_response_ok(response):
-            return ProvisioningResult(
-                status=ProvisioningStatus.COMMAND_ERROR,
-                message="Failed to set serial number"
-            )
-        
-        # Step 3: Set region
-        self._logger.info("SerialProvisioner", f"Setting region: {region}")
-        response = self.send_command(f"PROV SET_REGION {region}")
-        if not self._check_response_ok(response):
-            return ProvisioningResult(
-                status=ProvisioningStatus.COMMAND_ERROR,
-                message="Failed to set region"
-            )
+        # Send all three in one write; the console handles them in order
+        pipelined = self.send_pipeline([command for command, _, _ in steps])
+        if pipelined is None:
+            # The pipelined write never went out; send one at a time instead
+            for command, _, failure in steps:
+                response = self.send_command(command)
+                if not self._check_response_ok(response):
+                    return ProvisioningResult(
+                        status=ProvisioningStatus.COMMAND_ERROR,
+                        message=failure
+                    )
+        else:
+            acknowledged, failed = pipelined
+            if failed:
+                return ProvisioningResult(
+                    status=ProvisioningStatus.COMMAND_ERROR,
+                    message=steps[acknowledged][2]
+                )
+            # Commands without an explicit OK are accepted as long as no
+            # error came back, like _check_response_ok; PROV STATUS below
+            # confirms the result
         
         # Step 4: Verify provisioning status (allow brief settle time)
         self._logger.info("SerialProvisioner", "Verifying provisioning status...")
         status_info = {}
-        attempts = 3
-        for i in range(attempts):
-            response = self.send_command("PROV STATUS")
+        # Return as soon as both fields are in; resend once if nothing came back
+        for _ in range(2):
+            response = self.send_command("PROV STATUS", done=self._status_complete)
             if response:
                 status_info = self._parse_status(response)
-                if status_info.get('serial_number') and status_info.get('region'):
-                    break
-            if i < attempts - 1:
-                time.sleep(0.5)
+                break
         if not status_info:
             return ProvisioningResult(
                 status=ProvisioningStatus.COMMAND_ERROR,
@@ -391,13 +875,8 @@ class SerialProvisioner:
     # Compatibility wrapper expected by GUI
     def provision(self, port: str, serial_number: str, region_code: str) -> ProvisioningResult:
         # Try to connect with brief retries to avoid udev permission race
-        connected = False
-        for attempt in range(10):
-            if self.connect(port, silence=(attempt > 0)):
-                connected = True
-                break
-            time.sleep(0.2)
-        if not connected:
+        attempt = self._connect_with_retry(port, attempts=10, interval=0.2)
+        if attempt is None:
             return ProvisioningResult(status=ProvisioningStatus.PORT_ERROR, message="Failed to open port")
         # Consolidated success if connected during a silent attempt
         if attempt > 0:
@@ -416,10 +895,16 @@ class SerialProvisioner:
             True if command was sent
         """
         self._logger.info("SerialProvisioner", "Sending reboot command...")
-        response = self.send_command("REBOOT", expect_response=False)
+        response = self.send_command("REBOOT", expect_response=False, flush=True)
         time.sleep(CONFIG.SERIAL_REBOOT_WAIT)
         return response is not None
 
+    def _get_detector(self) -> DeviceDetector:
+        """Return the provisioner's DeviceDetector, creating it on first use."""
+        if self._detector is None:
+            self._detector = DeviceDetector()
+        return self._detector
+
     def reboot_and_reconnect_wait_ready(self, timeout: float = None) -> Optional[str]:
         """Reboot device, wait for RP2040 serial port (same or new), reconnect, and wait for readiness.
 
@@ -436,16 +921,16 @@ class SerialProvisioner:
         if self.is_connected:
             try:
                 self._logger.info("SerialProvisioner", "Rebooting device...")
-                _ = self.send_command("REBOOT", expect_response=False)
-            except Exception:
+                _ = self.send_command("REBOOT", expect_response=False, flush=True)
+            except serial.SerialException:
                 pass
 
-        detector = DeviceDetector()
+        detector = self._get_detector()
 
         # On Windows the device may reappear on the SAME COM port; on Linux typically a new port.
         # Try the same-port reappearance first, then fall back to new-port detection excluding the old.
         new_port: Optional[str] = None
-        start = time.time()
+        start = time.monotonic()
 
         if sys.platform == "win32" and old_port:
             # Windows: device may reappear on the SAME COM port
@@ -454,7 +939,7 @@ class SerialProvisioner:
 
             if not new_port:
                 # Use remaining time to look for a new port, excluding the previous one
-                remaining = max(0.0, timeout - (time.time() - start))
+                remaining = max(0.0, timeout - (time.monotonic() - start))
                 exclude = [old_port] if old_port else None
                 new_port = detector.wait_for_serial_port(timeout=remaining or 0.1, exclude_ports=exclude)
         else:
@@ -467,13 +952,7 @@ class SerialProvisioner:
             return None
 
         # Connect immediately and wait for readiness (retry briefly to avoid race with OS enumeration)
-        connected = False
-        for attempt in range(10):
-            if self.connect(new_port, silence=True):
-                connected = True
-                break
-            time.sleep(0.1)
-        if not connected:
+        if self._connect_with_retry(new_port, attempts=10, interval=0.1, silence=True) is None:
             self._logger.error("SerialProvisioner", f"Unable to open serial port: {new_port}")
             return None
         # Single consolidated connection log (success only to reduce noise)
@@ -497,7 +976,7 @@ class SerialProvisioner:
             True if command was sent successfully (write succeeded)
         """
         self._logger.info("SerialProvisioner", "Sending BOOTSEL command...")
-        response = self.send_command("BOOTSEL", expect_response=False)
+        response = self.send_command("BOOTSEL", expect_response=False, flush=True)
         # Device typically drops serial immediately; caller should handle disappearance
         return response is not None
     
@@ -525,51 +1004,70 @@ class SerialProvisioner:
             return None
         return self._parse_info_response(response)
     
+    def get_system_and_network_info(self) -> Tuple[Optional[dict], Optional[dict]]:
+        """
+        Get system and network information with one pipelined exchange.
+        
+        Both commands are written back-to-back so the device answers them in
+        a single response window. The replies are split at the console's
+        echo of NETINFO; if the device does not echo commands, the replies
+        cannot be told apart and both are queried again one at a time. The
+        same happens for either side that comes back empty.
+        
+        Returns:
+            Tuple of (sysinfo, netinfo); either may be None on error
+        """
+        response = self._exchange(["SYSINFO", "NETINFO"], 3.0, True, None, False)
+        if not response:
+            return None, None
+        
+        echoes = [_INFO_ECHO_RE.search(line) for line in response]
+        split = None
+        for i, echo in enumerate(echoes):
+            if echo and echo.group(1) == "NETINFO":
+                split = i
+                break
+        if split is None:
+            self._logger.info(
+                "SerialProvisioner",
+                "No NETINFO echo; querying SYSINFO and NETINFO separately"
+            )
+            return self.get_system_info(), self.get_network_info()
+        
+        sys_lines = [
+            line for line, echo in zip(response[:split], echoes)
+            if not (echo and echo.group(1) == "SYSINFO")
+        ]
+        net_lines = response[split + 1:]
+        # A side that came back empty is asked for again on its own
+        sysinfo = self._parse_info_response(sys_lines) if sys_lines else self.get_system_info()
+        netinfo = self._parse_info_response(net_lines) if net_lines else self.get_network_info()
+        return sysinfo, netinfo
+    
     def _check_response_ok(self, response: Optional[List[str]]) -> bool:
         """Check if response indicates success."""
         if not response:
             return False
         
         for line in response:
-            if "OK" in line.upper() or "SUCCESS" in line.upper():
+            if _OK_RE.search(line):
                 return True
-            if "ERROR" in line.upper() or "FAIL" in line.upper():
+            if _FAIL_RE.search(line):
                 return False
         
         # Assume OK if no explicit error
         return True
     
+    def _status_complete(self, response: List[str]) -> bool:
+        """Check whether a PROV STATUS response already holds SN and region."""
+        status = _parse_status_lines(tuple(response))
+        return bool(status.get('serial_number') and status.get('region'))
+    
     def _parse_status(self, response: List[str]) -> dict:
         """Parse PROV STATUS response into dict with normalized keys."""
+        # Copy so callers can't mutate the cached parse
         result = {'raw': response}
-        for line in response:
-            # Strip optional log prefix tags like [ECHO], [INFO]
-            line = re.sub(r"^\[[^\]]+\]\s*", "", line)
-            if ':' in line:
-                key, value = line.split(':', 1)
-                # Normalize keys: lowercase and replace non-alnum with underscores
-                key = re.sub(r"[^a-z0-9]+", "_", key.strip().lower())
-                value = value.strip()
-                result[key] = value
-        # Map common aliases
-        if 'serial_number' not in result:
-            if 'device_serial' in result:
-                result['serial_number'] = result['device_serial']
-            elif 'sn' in result:
-                result['serial_number'] = result['sn']
-            elif 's_n' in result:
-                result['serial_number'] = result['s_n']
-            elif 'serial' in result:
-                result['serial_number'] = result['serial']
-        # Normalize region value to code (EU/US)
-        if 'region' not in result and 'region_code' in result:
-            result['region'] = result['region_code']
-        if 'region' in result:
-            val = result['region']
-            for code in CONFIG.REGION_CODES:
-                if code in val:
-                    result['region'] = code
-                    break
+        result.update(_parse_status_lines(tuple(response)))
         return result
     
     def _parse_info_response(self, response: List[str]) -> dict:
@@ -577,31 +1075,13 @@ class SerialProvisioner:
         result = {'raw': response}
         for line in response:
             # Strip optional log prefix tags
-            line = re.sub(r"^\[[^\]]+\]\s*", "", line)
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = re.sub(r"[^a-z0-9]+", "_", key.strip().lower())
-                result[key] = value.strip()
-            elif '=' in line:
-                key, value = line.split('=', 1)
-                key = re.sub(r"[^a-z0-9]+", "_", key.strip().lower())
-                result[key] = value.strip()
-        # Common aliases for callers
-        if 'serial_number' not in result:
-            if 'device_serial' in result:
-                result['serial_number'] = result['device_serial']
-            elif 'sn' in result:
-                result['serial_number'] = result['sn']
-            elif 's_n' in result:
-                result['serial_number'] = result['s_n']
-            elif 'serial' in result:
-                result['serial_number'] = result['serial']
-        if 'region' not in result and 'region_code' in result:
-            result['region'] = result['region_code']
-        if 'region' in result:
-            val = result['region']
-            for code in CONFIG.REGION_CODES:
-                if code in val:
-                    result['region'] = code
-                    break
-        return result
\ No newline at end of file
+            line = _TAG_RE.sub("", line)
+            key, sep, value = line.partition(':')
+            if not sep:
+                key, sep, value = line.partition('=')
+            if sep:
+                result[_normalize_key(key)] = value.strip()
+        # SYSINFO/NETINFO have always received the same aliases as PROV STATUS:
+        # Verifier compares serial_number and the bare region code (EU/US)
+        _apply_key_aliases(result)
+        return result
@@ -3,15 +3,50 @@ Post-reboot verification module.
 
 Verifies device configuration persisted correctly after reboot.
 """
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from config.settings import CONFIG
 from utils.logger import get_logger
+from utils.port_cache import is_port_present
 from core.serial_provisioner import SerialProvisioner
 
 
+# SYSINFO keys that may carry each value, in order of preference
+_SERIAL_KEYS = ('serial_number', 'device_serial', 'sn', 'serial')
+_REGION_KEYS = ('region', 'region_code')
+_FW_KEYS = ('firmware_version', 'fw_version', 'firmware', 'version')
+_HW_KEYS = ('hardware_version', 'hw_version', 'hardware')
+
+# Check names, interned so ChecksView lookups hit on identity
+_NAME_SERIAL = sys.intern("Serial Number")
+_NAME_REGION = sys.intern("Region")
+_NAME_FIRMWARE = sys.intern("Firmware Version")
+_NAME_HARDWARE = sys.intern("Hardware Version")
+
+# Slotted dataclasses need Python 3.10; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _norm(value: str) -> str:
+    """Normalize a value for case- and whitespace-insensitive comparison."""
+    return value.strip().lower()
+
+
+def _first_value(info: Dict[str, str], keys: Tuple[str, ...], default: str = "") -> str:
+    """Return the first non-empty value among keys, or default."""
+    get = info.get
+    for key in keys:
+        value = get(key)
+        if value:
+            return value
+    return default
+
+
 class VerificationStatus(Enum):
     """Verification result status."""
     PASSED = "passed"
@@ -20,7 +55,7 @@ class VerificationStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VerificationCheck:
     """Single verification check result."""
     name: str
@@ -30,7 +65,7 @@ class VerificationCheck:
     message: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VerificationResult:
     """Complete verification result."""
     status: VerificationStatus
@@ -38,6 +73,18 @@ class VerificationResult:
     checks: List[VerificationCheck] = field(default_factory=list)
     sysinfo: Dict[str, str] = field(default_factory=dict)
     netinfo: Dict[str, str] = field(default_factory=dict)
+    # Running tallies kept by add_check
+    _passed: int = field(default=0, init=False, repr=False, compare=False)
+    _failed: int = field(default=0, init=False, repr=False, compare=False)
+    # Check names and outcomes in append order, for building ChecksView maps
+    _names: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _outcomes: List[bool] = field(default_factory=list, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._names = [c.name for c in self.checks]
+        self._outcomes = [c.passed for c in self.checks]
+        self._passed = sum(self._outcomes)
+        self._failed = len(self.checks) - self._passed
     
     @property
     def success(self) -> bool:
@@ -45,21 +92,46 @@ class VerificationResult:
     
     @property
     def passed_count(self) -> int:
-        return sum(1 for c in self.checks if c.passed)
+        return self._passed
     
     @property
     def failed_count(self) -> int:
-        return sum(1 for c in self.checks if not c.passed)
+        return self._failed
     
     def add_check(
         self,
         name: str,
         expected: str,
         actual: str,
-        message: str = ""
+        message: str = "",
+        expected_norm: Optional[str] = None,
+        actual_norm: Optional[str] = None
     ) -> bool:
-        """Add a verification check."""
-        passed = expected.strip().lower() == actual.strip().lower()
+        """
+        Add a verification check.
+        
+        Args:
+            name: Check name
+            expected: Expected value
+            actual: Value reported by the device
+            message: Optional detail message
+            expected_norm: Already normalized expected value, if available
+            actual_norm: Already normalized actual value, if available
+        
+        Returns:
+            True if the values match
+        """
+        if expected_norm is None:
+            expected_norm = _norm(expected)
+        if actual_norm is None:
+            actual_norm = _norm(actual)
+        passed = expected_norm == actual_norm
+        if passed:
+            self._passed += 1
+        else:
+            self._failed += 1
+        self._names.append(name)
+        self._outcomes.append(passed)
         self.checks.append(VerificationCheck(
             name=name,
             expected=expected,
@@ -87,6 +159,8 @@ class Verifier:
         """
         self._logger = get_logger()
         self._provisioner = provisioner
+        # (monotonic time, sysinfo) of the last quick_check query
+        self._sysinfo_cache: Optional[Tuple[float, Dict[str, str]]] = None
     
     def verify(
         self,
@@ -108,37 +182,35 @@ class Verifier:
             VerificationResult with all check results
         """
         self._logger.info("Verifier", "Starting verification sequence")
+        self._sysinfo_cache = None
         
         result = VerificationResult(
             status=VerificationStatus.ERROR,
             message=""
         )
         
-        # Get SYSINFO
-        self._logger.info("Verifier", "Querying SYSINFO...")
-        sysinfo = self._provisioner.get_system_info()
+        # Get SYSINFO and NETINFO in one pipelined exchange
+        self._logger.info("Verifier", "Querying SYSINFO and NETINFO...")
+        sysinfo, netinfo = self._provisioner.get_system_and_network_info()
         if not sysinfo:
             result.message = "Failed to get SYSINFO from device"
             self._logger.error("Verifier", result.message)
             return result
         
         result.sysinfo = sysinfo
-        self._logger.debug("Verifier", f"SYSINFO: {sysinfo}")
+        self._logger.debug("Verifier", "SYSINFO: %s", sysinfo)
         
-        # Get NETINFO
-        self._logger.info("Verifier", "Querying NETINFO...")
-        netinfo = self._provisioner.get_network_info()
         if netinfo:
             result.netinfo = netinfo
-            self._logger.debug("Verifier", f"NETINFO: {netinfo}")
+            self._logger.debug("Verifier", "NETINFO: %s", netinfo)
         else:
             self._logger.warning("Verifier", "NETINFO not available")
         
-        # Run verification checks
-        self._verify_serial_number(result, serial_number, sysinfo)
-        self._verify_region(result, region, sysinfo)
-        self._verify_firmware(result, firmware_version, sysinfo)
-        self._verify_hardware(result, hardware_version, sysinfo)
+        # Run verification checks (expected values normalized once up front)
+        self._verify_serial_number(result, serial_number, sysinfo, _norm(serial_number))
+        self._verify_region(result, region, sysinfo, _norm(region))
+        self._verify_firmware(result, firmware_version, sysinfo, _norm(firmware_version))
+        self._verify_hardware(result, hardware_version, sysinfo, _norm(hardware_version))
         
         # Determine overall status
         if result.failed_count == 0:
@@ -162,22 +234,19 @@ class Verifier:
         self,
         result: VerificationResult,
         expected: str,
-        sysinfo: Dict[str, str]
+        sysinfo: Dict[str, str],
+        expected_norm: Optional[str] = None
     ) -> None:
         """Verify serial number matches."""
         # Try different possible key names
-        actual = (
-            sysinfo.get('serial_number') or
-            sysinfo.get('device_serial') or
-            sysinfo.get('sn') or
-            sysinfo.get('serial') or
-            ""
-        )
+        actual = _first_value(sysinfo, _SERIAL_KEYS)
         
         passed = result.add_check(
-            name="Serial Number",
+            name=_NAME_SERIAL,
             expected=expected,
+            expected_norm=expected_norm,
             actual=actual,
+            actual_norm=_norm(actual),
             message="" if actual else "Serial number not found in SYSINFO"
         )
         
@@ -193,19 +262,18 @@ class Verifier:
         self,
         result: VerificationResult,
         expected: str,
-        sysinfo: Dict[str, str]
+        sysinfo: Dict[str, str],
+        expected_norm: Optional[str] = None
     ) -> None:
         """Verify region code matches."""
-        actual = (
-            sysinfo.get('region') or
-            sysinfo.get('region_code') or
-            ""
-        )
+        actual = _first_value(sysinfo, _REGION_KEYS)
         
         passed = result.add_check(
-            name="Region",
+            name=_NAME_REGION,
             expected=expected,
+            expected_norm=expected_norm,
             actual=actual,
+            actual_norm=_norm(actual),
             message="" if actual else "Region not found in SYSINFO"
         )
         
@@ -221,21 +289,18 @@ class Verifier:
         self,
         result: VerificationResult,
         expected: str,
-        sysinfo: Dict[str, str]
+        sysinfo: Dict[str, str],
+        expected_norm: Optional[str] = None
     ) -> None:
         """Verify firmware version matches."""
-        actual = (
-            sysinfo.get('firmware_version') or
-            sysinfo.get('fw_version') or
-            sysinfo.get('firmware') or
-            sysinfo.get('version') or
-            ""
-        )
+        actual = _first_value(sysinfo, _FW_KEYS)
         
         passed = result.add_check(
-            name="Firmware Version",
+            name=_NAME_FIRMWARE,
             expected=expected,
+            expected_norm=expected_norm,
             actual=actual,
+            actual_norm=_norm(actual),
             message="" if actual else "Firmware version not found in SYSINFO"
         )
         
@@ -251,20 +316,18 @@ class Verifier:
         self,
         result: VerificationResult,
         expected: str,
-        sysinfo: Dict[str, str]
+        sysinfo: Dict[str, str],
+        expected_norm: Optional[str] = None
     ) -> None:
         """Verify hardware version matches."""
-        actual = (
-            sysinfo.get('hardware_version') or
-            sysinfo.get('hw_version') or
-            sysinfo.get('hardware') or
-            ""
-        )
+        actual = _first_value(sysinfo, _HW_KEYS)
         
         passed = result.add_check(
-            name="Hardware Version",
+            name=_NAME_HARDWARE,
             expected=expected,
+            expected_norm=expected_norm,
             actual=actual,
+            actual_norm=_norm(actual),
             message="" if actual else "Hardware version not found in SYSINFO"
         )
         
@@ -286,24 +349,42 @@ class Verifier:
         Returns:
             True if serial matches
         """
-        sysinfo = self._provisioner.get_system_info()
+        cached = self._sysinfo_cache
+        if cached is not None and time.monotonic() - cached[0] < CONFIG.QUICK_CHECK_TTL:
+            sysinfo = cached[1]
+        else:
+            sysinfo = self._provisioner.get_system_info()
+            # Age counts from when the reply finished arriving
+            self._sysinfo_cache = (time.monotonic(), sysinfo) if sysinfo else None
         if not sysinfo:
             return False
         
-        actual = (
-            sysinfo.get('serial_number') or
-            sysinfo.get('sn') or
-            sysinfo.get('serial') or
-            ""
-        )
+        actual = _first_value(sysinfo, _SERIAL_KEYS)
         
-        return actual.strip().lower() == serial_number.strip().lower()
+        return _norm(actual) == _norm(serial_number)
 
 class ChecksView:
     """Compatibility wrapper that behaves like both a list and a dict view."""
-    def __init__(self, checks: List[VerificationCheck]):
+    def __init__(
+        self,
+        checks: List[VerificationCheck],
+        names: Optional[List[str]] = None,
+        outcomes: Optional[List[bool]] = None
+    ):
         self._checks = checks
-        self._map = {c.name: c.passed for c in checks}
+        # Parallel name/passed lists, if the caller already has them
+        self._names = names
+        self._outcomes = outcomes
+        # Name -> passed mapping, built on first dict-style access only
+        self._map_cache: Optional[Dict[str, bool]] = None
+    @property
+    def _map(self) -> Dict[str, bool]:
+        if self._map_cache is None:
+            if self._names is not None and self._outcomes is not None:
+                self._map_cache = dict(zip(self._names, self._outcomes))
+            else:
+                self._map_cache = {c.name: c.passed for c in self._checks}
+        return self._map_cache
     def __iter__(self):
         return iter(self._checks)
     def items(self):
@@ -314,6 +395,11 @@ class ChecksView:
         return self._map.values()
 
 
+# Shared workers for DeviceVerifier.verify_async, so repeated
+# verifications reuse threads
+_verify_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="verify")
+
+
 class DeviceVerifier:
     """Compatibility verifier exposing the older API used by GUI."""
     def __init__(self, logger=None):
@@ -327,6 +413,8 @@ class DeviceVerifier:
         expected_firmware: str,
         expected_hardware: str
     ) -> VerificationResult:
+        if not is_port_present(port):
+            return VerificationResult(status=VerificationStatus.ERROR, message="Port not present")
         prov = SerialProvisioner(self._logger)
         if not prov.connect(port):
             return VerificationResult(status=VerificationStatus.ERROR, message="Unable to open serial port")
@@ -339,9 +427,42 @@ class DeviceVerifier:
             firmware_version=expected_firmware,
             hardware_version=expected_hardware
         )
-        # Provide a dict-like view for checks while keeping list iteration
-        result.checks = ChecksView(result.checks)  # type: ignore[assignment]
         prov.disconnect()
         # Provide a dict-like view for checks to support legacy GUI usage (.items())
-        result.checks = ChecksView(result.checks)  # type: ignore[assignment]
-        return result
\ No newline at end of file
+        result.checks = ChecksView(  # type: ignore[assignment]
+            result.checks, result._names, result._outcomes
+        )
+        return result
+    
+    def verify_async(
+        self,
+        port: str,
+        expected_serial: str,
+        expected_region: str,
+        expected_firmware: str,
+        expected_hardware: str
+    ) -> "Future[VerificationResult]":
+        """
+        Run verify() on a background worker.
+        
+        Done callbacks run on the worker thread; GUI callers must marshal
+        the result back to Tk (e.g. with widget.after).
+        
+        Args:
+            port: Serial port of the device
+            expected_serial: Expected serial number
+            expected_region: Expected region code
+            expected_firmware: Expected firmware version
+            expected_hardware: Expected hardware version
+        
+        Returns:
+            Future resolving to the VerificationResult
+        """
+        return _verify_pool.submit(
+            self.verify,
+            port,
+            expected_serial,
+            expected_region,
+            expected_firmware,
+            expected_hardware
+        )
\ No newline at end of file
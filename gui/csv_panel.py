@@ -7,10 +7,20 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Callable, Optional
 
-from core.csv_manager import CSVManager, CSVRow
+from core.csv_manager import CSVManager, CSVRow, DisplayColumns
 from utils.persistence import PersistenceManager
 
 
+# Status column text and row tag, indexed by is_programmed
+_STATUS_TEXT = ("Pending", "Done")
+_STATUS_TAG = ("unprogrammed", "programmed")
+
+# Only a window of rows around the viewport is kept in the tree; it is
+# moved once scrolling comes within _TREE_MARGIN rows of either end
+_TREE_WINDOW = 400
+_TREE_MARGIN = 80
+
+
 class CSVPanel(ttk.LabelFrame):
     """
     Panel for CSV file management and row selection.
@@ -40,6 +50,10 @@ class CSVPanel(ttk.LabelFrame):
         self._persistence = persistence
         self._on_row_selected = on_row_selected
         self._suppress_selection_event = False
+        # CSV row range [start, end) currently inserted in the tree
+        self._win_start = 0
+        self._win_end = 0
+        self._rewindow_pending = False
         
         self._create_widgets()
         self._load_last_csv()
@@ -143,16 +157,16 @@ class CSVPanel(ttk.LabelFrame):
         self._tree.column("fw", width=80)
         self._tree.column("region", width=50, anchor="center")
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(
+        # Scrollbar (spans all CSV rows, not just those in the tree)
+        self._scrollbar = ttk.Scrollbar(
             list_frame,
             orient=tk.VERTICAL,
-            command=self._tree.yview
+            command=self._on_scrollbar
         )
-        self._tree.configure(yscrollcommand=scrollbar.set)
+        self._tree.configure(yscrollcommand=self._on_tree_yscroll)
         
         self._tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind selection
         self._tree.bind("<<TreeviewSelect>>", self._on_tree_select)
@@ -187,13 +201,33 @@ class CSVPanel(ttk.LabelFrame):
         
         if filepath:
             # Use public wrapper to ensure callbacks (on_csv_loaded) are invoked
-            self.load_csv(filepath)
+            self.load_csv(filepath, background=True)
 
     # -----------------------------------------------------------------
     # Public wrappers for MainWindow compatibility
     # -----------------------------------------------------------------
-    def load_csv(self, filepath: str) -> None:
+    def load_csv(self, filepath: str, background: bool = False) -> None:
+        if background:
+            # Parse off the Tk thread; finish on it once the worker is done
+            self._browse_btn.config(state=tk.DISABLED)
+            self._reload_btn.config(state=tk.DISABLED)
+            self._csv_manager.load_async(
+                filepath,
+                lambda ok: self.after(0, self._finish_background_load, filepath, ok)
+            )
+            return
         self._load_csv(filepath)
+        self._notify_csv_loaded()
+    
+    def _finish_background_load(self, filepath: str, ok: bool) -> None:
+        """Apply a background CSV load on the Tk thread."""
+        self._browse_btn.config(state=tk.NORMAL)
+        if self._csv_manager.is_loaded:
+            self._reload_btn.config(state=tk.NORMAL)
+        self._apply_load_result(filepath, ok)
+        self._notify_csv_loaded()
+    
+    def _notify_csv_loaded(self) -> None:
         # Notify if MainWindow attached a callback
         if hasattr(self, 'on_csv_loaded') and callable(getattr(self, 'on_csv_loaded')):
             try:
@@ -211,7 +245,11 @@ class CSVPanel(ttk.LabelFrame):
     
     def _load_csv(self, filepath: str) -> None:
         """Load CSV file."""
-        if self._csv_manager.load(filepath):
+        self._apply_load_result(filepath, self._csv_manager.load(filepath))
+    
+    def _apply_load_result(self, filepath: str, ok: bool) -> None:
+        """Refresh the panel after a load attempt."""
+        if ok:
             self._file_var.set(filepath)
             self._persistence.set("last_csv_path", filepath)
             self._persistence.add_recent_csv(filepath)
@@ -229,21 +267,129 @@ class CSVPanel(ttk.LabelFrame):
         path = self._csv_manager.path
         if path:
             # Use public wrapper so status and callbacks refresh
-            self.load_csv(str(path))
+            self.load_csv(str(path), background=True)
     
     def _update_display(self) -> None:
         """Update all display elements."""
-        # Clear tree
-        for item in self._tree.get_children():
-            self._tree.delete(item)
-
-        # Populate rows incrementally to keep UI responsive on large CSVs
-        self._rows_cache = list(self._csv_manager.rows)
-        self._populate_chunk_index = 0
-        self._populate_chunk_size = 500
-        self._populate_tree_chunk()
+        self._rebuild_tree()
+        self._refresh_stats()
+        self._update_selection_display()
+    
+    def _rebuild_tree(self) -> None:
+        """Repopulate the tree from the loaded rows."""
+        # Clear tree in a single call
+        self._tree.delete(*self._tree.get_children())
+        self._win_start = self._win_end = 0
+        
+        # Start with the window around the selected row
+        idx = self._csv_manager.selected_index
+        self._show_window(idx if idx is not None else 0)
+    
+    def _show_window(self, center: int) -> None:
+        """
+        Move the tree's row window so it contains center.
+        
+        Rows that stay in the window are left in place; only rows entering
+        or leaving it are inserted or deleted.
+        
+        Args:
+            center: CSV row index to place near the middle of the window
+        """
+        columns = self._csv_manager.display_columns
+        total = len(columns[0])
+        start = max(0, min(center - _TREE_WINDOW // 2, total - _TREE_WINDOW))
+        end = min(total, start + _TREE_WINDOW)
+        old_start, old_end = self._win_start, self._win_end
+        if start == old_start and end == old_end:
+            return
         
-        # Update statistics
+        tree = self._tree
+        row_display = self._row_display
+        insert = tree.insert
+        if start >= old_end or end <= old_start:
+            # No overlap: replace everything
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            for idx in range(start, end):
+                values, tag = row_display(columns, idx)
+                insert("", tk.END, str(idx), values=values, tags=tag)
+        else:
+            leaving = [str(i) for i in range(old_start, start)]
+            leaving.extend(str(i) for i in range(end, old_end))
+            if leaving:
+                tree.delete(*leaving)
+            for idx in range(min(old_start, end) - 1, start - 1, -1):
+                values, tag = row_display(columns, idx)
+                insert("", 0, str(idx), values=values, tags=tag)
+            for idx in range(max(old_end, start), end):
+                values, tag = row_display(columns, idx)
+                insert("", tk.END, str(idx), values=values, tags=tag)
+        self._win_start, self._win_end = start, end
+        
+        # Deleting the selected item drops the selection; restore it
+        idx = self._csv_manager.selected_index
+        if idx is not None and start <= idx < end:
+            target = str(idx)
+            if target not in tree.selection():
+                self._suppress_selection_event = True
+                tree.selection_set(target)
+                self.after_idle(self._clear_suppress)
+    
+    def _scroll_to_row(self, top: int) -> None:
+        """Scroll so CSV row top is first in view, moving the window if needed."""
+        self._rewindow_pending = False
+        total = self._csv_manager.row_count
+        if not total:
+            return
+        top = max(0, min(top, total - 1))
+        first, last = self._tree.yview()
+        visible = max(1, int((last - first) * (self._win_end - self._win_start)))
+        near_start = top - self._win_start < _TREE_MARGIN and self._win_start > 0
+        near_end = self._win_end - (top + visible) < _TREE_MARGIN and self._win_end < total
+        if near_start or near_end or not self._win_start <= top < self._win_end:
+            self._show_window(top + visible // 2)
+        count = self._win_end - self._win_start
+        if count:
+            self._tree.yview_moveto((top - self._win_start) / count)
+    
+    def _on_scrollbar(self, *args) -> None:
+        """Translate scrollbar actions on the full row range to the tree."""
+        if args and args[0] == "moveto":
+            total = self._csv_manager.row_count
+            self._scroll_to_row(int(float(args[1]) * total))
+        else:
+            # Unit/page steps scroll the tree; edges are handled on yscroll
+            self._tree.yview(*args)
+    
+    def _on_tree_yscroll(self, first: str, last: str) -> None:
+        """Map the tree's view onto the scrollbar and move the window near its edges."""
+        total = self._csv_manager.row_count
+        count = self._win_end - self._win_start
+        if not total or not count:
+            self._scrollbar.set(0.0, 1.0)
+            return
+        top = self._win_start + float(first) * count
+        bottom = self._win_start + float(last) * count
+        self._scrollbar.set(top / total, bottom / total)
+        
+        near_start = top - self._win_start < _TREE_MARGIN and self._win_start > 0
+        near_end = self._win_end - bottom < _TREE_MARGIN and self._win_end < total
+        if (near_start or near_end) and not self._rewindow_pending:
+            # Avoid changing the tree from inside its own scroll callback
+            self._rewindow_pending = True
+            self.after_idle(self._scroll_to_row, int(top))
+    
+    def _refresh_row(self, idx: int) -> None:
+        """Redraw a single row whose values changed in place."""
+        iid = str(idx)
+        # Rows outside the window are drawn from the same objects when shown
+        if self._tree.exists(iid):
+            values, tag = self._row_display(self._csv_manager.display_columns, idx)
+            self._tree.item(iid, values=values, tags=(tag,))
+    
+    def _refresh_stats(self) -> None:
+        """Update the statistics label and progress bar."""
         stats = self._csv_manager.get_statistics()
         self._stats_label.config(
             text=f"Total: {stats['total']} | "
@@ -251,39 +397,14 @@ class CSVPanel(ttk.LabelFrame):
                  f"Remaining: {stats['remaining']}"
         )
         self._progress_var.set(stats['progress_percent'])
-        
-        # Update selection display
-        self._update_selection_display()
 
-    def _populate_tree_chunk(self) -> None:
-        """Insert a chunk of rows into the tree to avoid UI stalls."""
-        if not hasattr(self, "_rows_cache"):
-            return
-        end = min(self._populate_chunk_index + self._populate_chunk_size, len(self._rows_cache))
-        for idx in range(self._populate_chunk_index, end):
-            row = self._rows_cache[idx]
-            status = "Done" if row.is_programmed else "Pending"
-            tag = "programmed" if row.is_programmed else "unprogrammed"
-            self._tree.insert(
-                "",
-                tk.END,
-                iid=str(idx),
-                values=(
-                    row.serial_number,
-                    status,
-                    row.date_programmed or "-",
-                    row.firmware_version or "-",
-                    row.region_code or "-"
-                ),
-                tags=(tag,)
-            )
-        self._populate_chunk_index = end
-        if end < len(self._rows_cache):
-            # Schedule next chunk
-            self.after(1, self._populate_tree_chunk)
-        else:
-            # Cleanup cache when done
-            del self._rows_cache
+    @staticmethod
+    def _row_display(columns: DisplayColumns, idx: int) -> tuple:
+        """Return the tree values and style tag for a row."""
+        serials, programmed, dates, fws, regions = columns
+        b = 1 if programmed[idx] else 0
+        values = (serials[idx], _STATUS_TEXT[b], dates[idx], fws[idx], regions[idx])
+        return values, _STATUS_TAG[b]
     
     def _update_selection_display(self) -> None:
         """Update selection label and tree highlight."""
@@ -299,15 +420,21 @@ class CSVPanel(ttk.LabelFrame):
                 current = self._tree.selection()
                 target = str(idx)
                 if not current or current[0] != target:
+                    if not self._tree.exists(target):
+                        self._show_window(idx)
                     # Suppress selection event and release after idle to avoid re-entrancy
                     self._suppress_selection_event = True
                     self._tree.selection_set(target)
                     self._tree.see(target)
                     # Delay unsetting suppression until after Tk processes events
-                    self.after_idle(lambda: setattr(self, "_suppress_selection_event", False))
+                    self.after_idle(self._clear_suppress)
         else:
             self._selected_var.set("None")
     
+    def _clear_suppress(self) -> None:
+        """Re-enable handling of tree selection events."""
+        self._suppress_selection_event = False
+    
     def _on_tree_select(self, event) -> None:
         """Handle row selection in treeview."""
         if self._suppress_selection_event:
@@ -360,6 +487,7 @@ class CSVPanel(ttk.LabelFrame):
         Returns:
             True if update successful
         """
+        idx = self._csv_manager.selected_index
         if self._csv_manager.update_selected_row(
             firmware_version=firmware_version,
             hardware_version=hardware_version,
@@ -369,7 +497,9 @@ class CSVPanel(ttk.LabelFrame):
         ):
             # Save immediately
             if self._csv_manager.save():
-                self._update_display()
+                self._refresh_row(idx)
+                self._refresh_stats()
+                self._update_selection_display()
                 return True
         return False
     
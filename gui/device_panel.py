@@ -3,13 +3,22 @@ Device detection panel for RP2040 Programmer GUI.
 
 Displays detected RP2040 devices and their states.
 """
+import time
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk, messagebox
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from core.device_detector import DeviceDetector, DetectedDevice, DeviceState
 
 
+# Seconds a device enumeration is reused by non-forced refreshes
+_ENUM_CACHE_TTL = 2.0
+
+# Detector notifications within this window are shown as one update
+_CHANGE_DEBOUNCE_MS = 120
+
+
 class DevicePanel(ttk.LabelFrame):
     """
     Panel displaying detected RP2040 devices.
@@ -38,6 +47,20 @@ class DevicePanel(ttk.LabelFrame):
         self._on_device_selected = on_device_selected
         self._on_enter_boot_mode = on_enter_boot_mode
         self._devices: List[DetectedDevice] = []
+        self._devices_by_id: Dict[str, DetectedDevice] = {}
+        # BOOTSEL devices in list order, rebuilt by _update_device_list
+        self._bootsel_devices: List[DetectedDevice] = []
+        # Values currently shown for each tree row, keyed by device ID
+        self._row_values: Dict[str, Tuple[str, str, str]] = {}
+        # (monotonic time, devices) of the last enumeration
+        self._enum_cache: Optional[Tuple[float, Sequence[DetectedDevice]]] = None
+        # Manual scans run here so enumeration never blocks the Tk thread
+        self._scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="device-scan")
+        self._scan_inflight = False
+        self._scan_callbacks: List[Callable[[], None]] = []
+        # Latest detector list and the after() id that will show it
+        self._pending_devices: List[DetectedDevice] = []
+        self._pending_update_id: Optional[str] = None
         
         self._create_widgets()
         self._setup_detector_callbacks()
@@ -72,7 +95,7 @@ class DevicePanel(ttk.LabelFrame):
         self._refresh_btn = ttk.Button(
             status_frame,
             text="Refresh",
-            command=self._refresh_devices,
+            command=lambda: self._refresh_devices(force=True),
             width=10
         )
         self._refresh_btn.pack(side=tk.RIGHT)
@@ -127,37 +150,109 @@ class DevicePanel(ttk.LabelFrame):
             on_changed=self._on_devices_changed
         )
     
-    def _refresh_devices(self) -> None:
-        """Manual refresh of device list."""
-        devices = self._detector.scan_once()
-        self._update_device_list(devices)
+    def _refresh_devices(
+        self,
+        force: bool = False,
+        on_complete: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Manual refresh of device list.
+        
+        Args:
+            force: Rescan even if a recent enumeration is cached
+            on_complete: Called on the Tk thread once the list has been updated
+        """
+        cached = self._enum_cache
+        if not force and cached is not None and time.monotonic() - cached[0] < _ENUM_CACHE_TTL:
+            self._update_device_list(cached[1])
+            if on_complete:
+                on_complete()
+            return
+        if on_complete:
+            self._scan_callbacks.append(on_complete)
+        if self._scan_inflight:
+            return  # The running scan will call on_complete
+        self._scan_inflight = True
+        future = self._scan_executor.submit(self._detector.scan_once)
+        future.add_done_callback(self._on_scan_done)
+    
+    def _on_scan_done(self, future: Future) -> None:
+        """Hand a finished scan to the Tk thread (runs on the scan worker)."""
+        try:
+            self.after(0, self._apply_scan_result, future)
+        except (tk.TclError, RuntimeError):
+            pass  # Panel already destroyed
+    
+    def _apply_scan_result(self, future: Future) -> None:
+        """Show the devices found by a background scan."""
+        self._scan_inflight = False
+        callbacks, self._scan_callbacks = self._scan_callbacks, []
+        try:
+            devices = future.result()
+        except Exception:
+            devices = None
+        if devices is not None:
+            self._enum_cache = (time.monotonic(), devices)
+            self._update_device_list(devices)
+        for callback in callbacks:
+            callback()
     
     def _on_devices_changed(self, devices: List[DetectedDevice]) -> None:
         """Handle device list change from detector."""
-        # Schedule GUI update on main thread
-        self.after(0, lambda: self._update_device_list(devices))
+        # The detector just scanned; later non-forced refreshes can reuse it
+        self._enum_cache = (time.monotonic(), devices)
+        # Coalesce bursts: the first notification schedules the GUI update on
+        # the main thread, later ones only replace the list it will show
+        self._pending_devices = devices
+        if self._pending_update_id is None:
+            self._pending_update_id = self.after(
+                _CHANGE_DEBOUNCE_MS, self._apply_pending_devices
+            )
+    
+    def _apply_pending_devices(self) -> None:
+        """Show the latest device list reported by the detector."""
+        # Clear the id first so a notification arriving now schedules anew
+        self._pending_update_id = None
+        self._update_device_list(self._pending_devices)
     
     def _update_device_list(self, devices: List[DetectedDevice]) -> None:
         """Update the device treeview."""
         self._devices = devices
+        new_by_id = {dev.device_id: dev for dev in devices}
+        row_values = self._row_values
         
-        # Clear existing items
-        for item in self._tree.get_children():
-            self._tree.delete(item)
-        
-        # Add devices
-        for dev in devices:
-            state_text = "BOOTSEL" if dev.state == DeviceState.BOOTSEL else "Serial"
-            self._tree.insert(
-                "",
-                tk.END,
-                iid=dev.device_id,
-                values=(state_text, dev.path, dev.description)
-            )
+        # Drop rows for devices that are gone
+        gone = [iid for iid in row_values if iid not in new_by_id]
+        if gone:
+            self._tree.delete(*gone)
+            for iid in gone:
+                del row_values[iid]
+        
+        # Add new devices and touch existing rows only if their values changed
+        bootsel: List[DetectedDevice] = []
+        serial_count = 0
+        for iid, dev in new_by_id.items():
+            if dev.state == DeviceState.BOOTSEL:
+                bootsel.append(dev)
+                state_text = "BOOTSEL"
+            else:
+                if dev.state == DeviceState.SERIAL:
+                    serial_count += 1
+                state_text = "Serial"
+            values = (state_text, dev.path, dev.description)
+            shown = row_values.get(iid)
+            if shown is None:
+                self._tree.insert("", tk.END, iid=iid, values=values)
+            elif shown != values:
+                self._tree.item(iid, values=values)
+            else:
+                continue
+            row_values[iid] = values
+        self._devices_by_id = new_by_id
+        self._bootsel_devices = bootsel
         
         # Update status
-        bootsel_count = len([d for d in devices if d.state == DeviceState.BOOTSEL])
-        serial_count = len([d for d in devices if d.state == DeviceState.SERIAL])
+        bootsel_count = len(bootsel)
         
         if bootsel_count > 0:
             self._status_label.config(
@@ -188,11 +283,9 @@ class DevicePanel(ttk.LabelFrame):
         """Handle device selection in treeview."""
         selection = self._tree.selection()
         if selection and self._on_device_selected:
-            device_id = selection[0]
-            for dev in self._devices:
-                if dev.device_id == device_id:
-                    self._on_device_selected(dev)
-                    break
+            dev = self._devices_by_id.get(selection[0])
+            if dev is not None:
+                self._on_device_selected(dev)
 
     def _on_bootsel_clicked(self) -> None:
         """Handle Enter BOOT Mode button click."""
@@ -219,26 +312,38 @@ class DevicePanel(ttk.LabelFrame):
         if not selection:
             return None
         
-        device_id = selection[0]
-        for dev in self._devices:
-            if dev.device_id == device_id:
-                return dev
-        return None
+        return self._devices_by_id.get(selection[0])
     
     def has_bootsel_device(self) -> bool:
         """Check if any BOOTSEL device is available."""
-        return any(d.state == DeviceState.BOOTSEL for d in self._devices)
+        return bool(self._bootsel_devices)
     
     def get_bootsel_device(self) -> Optional[DetectedDevice]:
         """Get first available BOOTSEL device."""
-        for dev in self._devices:
-            if dev.state == DeviceState.BOOTSEL:
-                return dev
-        return None
+        return self._bootsel_devices[0] if self._bootsel_devices else None
+
+    def destroy(self) -> None:
+        """Stop the scan worker and destroy the panel."""
+        self._scan_executor.shutdown(wait=False)
+        super().destroy()
 
     # -----------------------------------------------------------------
     # Compatibility wrapper expected by MainWindow
     # -----------------------------------------------------------------
+    def refresh_devices(
+        self,
+        force: bool = False,
+        on_complete: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Rescan for devices, reusing an enumeration younger than the cache TTL.
+        
+        Args:
+            force: Rescan even if a recent enumeration is cached
+            on_complete: Called on the Tk thread once the list has been updated
+        """
+        self._refresh_devices(force=force, on_complete=on_complete)
+    
     def refresh(self) -> None:
         """Refresh the device list display."""
         try:
@@ -4,13 +4,21 @@ Log panel for RP2040 Programmer GUI.
 Displays real-time log messages and process status.
 """
 import tkinter as tk
+from collections import deque
 from tkinter import ttk, filedialog
-from typing import Optional
+from typing import Deque, Optional
 
 from config.settings import CONFIG
 from utils.logger import LogEntry
 
 
+# Entries added within this window are written to the text widget together
+_FLUSH_INTERVAL_MS = 50
+
+# Lines allowed past LOG_MAX_LINES before trimming, so deletes are batched
+_TRIM_SLACK_LINES = 256
+
+
 class LogPanel(ttk.LabelFrame):
     """
     Panel displaying log messages and process progress.
@@ -27,6 +35,12 @@ class LogPanel(ttk.LabelFrame):
         """
         super().__init__(parent, text="Process Log", padding=10)
         
+        # Entries waiting for the next flush tick
+        self._log_queue: Deque[LogEntry] = deque()
+        self._flush_scheduled = False
+        # Newline-terminated lines in the text widget
+        self._line_count = 0
+        
         self._create_widgets()
     
     def _create_widgets(self) -> None:
@@ -110,23 +124,53 @@ class LogPanel(ttk.LabelFrame):
         """
         Add a log entry to display.
         
+        Entries are queued and written in batches on a short timer, so
+        bursts of log output cost one widget update per tick.
+        
         Args:
             entry: LogEntry to display
         """
-        self._log_text.config(state=tk.NORMAL)
+        self._log_queue.append(entry)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(_FLUSH_INTERVAL_MS, self._flush_log)
+    
+    def _flush_log(self) -> None:
+        """Write all queued entries to the text widget."""
+        self._flush_scheduled = False
+        queue = self._log_queue
+        if not queue:
+            return
         
         # Format: [timestamp] [level] [source] message
-        ts = entry.timestamp.strftime("%H:%M:%S.%f")[:-3]
+        # Text.insert takes alternating (chars, tags) pairs, so the whole
+        # batch goes in with a single call
+        chunks = []
+        append = chunks.append
+        lines = 0
+        while queue:
+            entry = queue.popleft()
+            ts = entry.timestamp.strftime("%H:%M:%S.%f")[:-3]
+            level = entry.level
+            append(f"[{ts}] ")
+            append("timestamp")
+            append(f"[{level}] ")
+            append(level)
+            append(f"[{entry.source}] ")
+            append("source")
+            append(f"{entry.message}\n")
+            append(level)
+            lines += entry.message.count("\n") + 1
         
-        self._log_text.insert(tk.END, f"[{ts}] ", "timestamp")
-        self._log_text.insert(tk.END, f"[{entry.level}] ", entry.level)
-        self._log_text.insert(tk.END, f"[{entry.source}] ", "source")
-        self._log_text.insert(tk.END, f"{entry.message}\n", entry.level)
+        self._log_text.config(state=tk.NORMAL)
+        self._log_text.insert(tk.END, *chunks)
         
-        # Limit lines
-        line_count = int(self._log_text.index('end-1c').split('.')[0])
-        if line_count > CONFIG.LOG_MAX_LINES:
-            self._log_text.delete('1.0', f'{line_count - CONFIG.LOG_MAX_LINES}.0')
+        # Limit lines, trimming only once the slack is used up
+        self._line_count += lines
+        excess = self._line_count - CONFIG.LOG_MAX_LINES
+        if excess > _TRIM_SLACK_LINES:
+            self._log_text.delete('1.0', f'{excess + 1}.0')
+            self._line_count = CONFIG.LOG_MAX_LINES
         
         self._log_text.config(state=tk.DISABLED)
         
@@ -170,6 +214,8 @@ class LogPanel(ttk.LabelFrame):
     
     def clear(self) -> None:
         """Clear all log entries."""
+        self._log_queue.clear()
+        self._line_count = 0
         self._log_text.config(state=tk.NORMAL)
         self._log_text.delete('1.0', tk.END)
         self._log_text.config(state=tk.DISABLED)
@@ -209,7 +255,7 @@ class LogPanel(ttk.LabelFrame):
         )
         
         if filepath:
-            content = self._log_text.get('1.0', tk.END)
+            content = self.get_log_content()
             try:
                 with open(filepath, 'w', encoding='utf-8') as f:
                     f.write(content)
@@ -219,4 +265,5 @@ class LogPanel(ttk.LabelFrame):
     
     def get_log_content(self) -> str:
         """Get all log content as string."""
+        self._flush_log()
         return self._log_text.get('1.0', tk.END)
\ No newline at end of file
@@ -19,7 +19,7 @@ from enum import Enum, auto
 from typing import Optional, Dict, Any
 
 from config.settings import Settings
-from utils.logger import AppLogger, LogLevel
+from utils.logger import AppLogger, LogLevel, get_logger
 from utils.persistence import PersistenceManager
 from core.device_detector import DeviceDetector, DeviceInfo, DeviceState
 from core.firmware_uploader import FirmwareUploader, UploadResult
@@ -88,8 +88,10 @@ class MainWindow:
         
         # Initialize components
         self.logger = AppLogger()
+        self._set_debug_logging(Settings.LOG_DEBUG)
         self.persistence = PersistenceManager()
         self.device_detector = DeviceDetector()
+        self.firmware_uploader = FirmwareUploader(self.logger)
         self.csv_manager: Optional[CSVManager] = CSVManager()
         
         # Workflow state
@@ -124,6 +126,11 @@ class MainWindow:
         self.logger.info("RP2040 Programmer started")
         self.logger.info(f"Platform: {Settings.PLATFORM}")
         
+    def _set_debug_logging(self, enabled: bool) -> None:
+        """Switch DEBUG entries on or off for the GUI and module loggers."""
+        self.logger.set_debug_enabled(enabled)
+        get_logger().set_debug_enabled(enabled)
+    
     def _create_menu(self):
         """Create application menu bar."""
         menubar = tk.Menu(self.root)
@@ -142,6 +149,12 @@ class MainWindow:
         menubar.add_cascade(label="Tools", menu=tools_menu)
         tools_menu.add_command(label="Refresh Devices", command=self._on_refresh_devices)
         tools_menu.add_command(label="Test Label Print", command=self._on_test_label)
+        self._debug_log_var = tk.BooleanVar(value=self.logger.is_debug_enabled())
+        tools_menu.add_checkbutton(
+            label="Debug Logging",
+            variable=self._debug_log_var,
+            command=lambda: self._set_debug_logging(self._debug_log_var.get())
+        )
         tools_menu.add_separator()
         tools_menu.add_command(label="Open Artefacts Folder", command=self._on_open_artefacts)
         
@@ -539,9 +552,8 @@ class MainWindow:
                 return
             self._queue_message({"type": "state", "state": WorkflowState.UPLOADING_FIRMWARE})
             
-            uploader = FirmwareUploader(self.logger)
             _t0 = time.time()
-            ctx.upload_result = uploader.upload(ctx.firmware_path, ctx.device_path)
+            ctx.upload_result = self.firmware_uploader.upload(ctx.firmware_path, ctx.device_path)
             report.firmware_upload_time = time.time() - _t0
             
             report.add_step(StepResult(
@@ -580,7 +592,7 @@ class MainWindow:
                 return
             self._queue_message({"type": "state", "state": WorkflowState.PROVISIONING})
             
-            provisioner = SerialProvisioner(self.logger)
+            provisioner = SerialProvisioner(self.logger, detector=self.device_detector)
             _t1 = time.time()
             ctx.provisioning_result = provisioner.provision(
                 port=ctx.serial_port,
@@ -784,9 +796,8 @@ class MainWindow:
         
     def _on_refresh_devices(self):
         """Handle Refresh Devices menu action."""
-        self.device_detector.scan_now()
-        self.device_panel.refresh()
-        self._update_device_count()
+        # The scan runs off the Tk thread; count the devices once it has finished
+        self.device_panel.refresh_devices(force=True, on_complete=self._update_device_count)
 
     def _on_enter_boot_mode(self, device: Optional[DeviceInfo] = None):
         """Send BOOTSEL command over serial to enter BOOT mode."""
@@ -810,7 +821,7 @@ class MainWindow:
                 return
 
             # Send BOOTSEL command; device should switch to BOOTSEL and drop serial
-            provisioner.send_command("BOOTSEL", expect_response=False)
+            provisioner.send_command("BOOTSEL", expect_response=False, flush=True)
             # Small grace period before disconnect
             time.sleep(0.2)
             provisioner.disconnect()
@@ -1,5 +1,9 @@
 """Utility modules for RP2040 Programmer."""
 from .logger import AppLogger, get_logger
 from .persistence import PersistenceManager
+from .port_cache import is_port_present, invalidate_port_cache
 
-__all__ = ['AppLogger', 'get_logger', 'PersistenceManager']
\ No newline at end of file
+__all__ = [
+    'AppLogger', 'get_logger', 'PersistenceManager',
+    'is_port_present', 'invalidate_port_cache'
+]
\ No newline at end of file
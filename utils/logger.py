@@ -7,7 +7,7 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -40,6 +40,8 @@ class AppLogger:
         self._file_handler: Optional[logging.FileHandler] = None
         self._serial_log_path: Optional[Path] = None
         self._serial_log_file = None
+        # Debug entries can be switched off wholesale; formatting is then skipped
+        self._debug_enabled = True
         
         # Setup standard Python logger
         self._logger = logging.getLogger(name)
@@ -66,6 +68,14 @@ class AppLogger:
     def set_callback(self, callback: Callable[[LogEntry], None]) -> None:
         self.set_gui_callback(callback)
     
+    def set_debug_enabled(self, enabled: bool) -> None:
+        """Enable or disable recording of debug messages."""
+        self._debug_enabled = enabled
+    
+    def is_debug_enabled(self) -> bool:
+        """Check whether debug messages are recorded."""
+        return self._debug_enabled
+    
     def set_file_log(self, path: Path) -> None:
         """Enable file logging to specified path."""
         if self._file_handler:
@@ -107,9 +117,11 @@ class AppLogger:
             self._serial_log_file.write(f"TX | {ts} | {data}\n")
             self._serial_log_file.flush()
     
-    def log_serial_rx(self, data: str) -> None:
-        """Log received serial data."""
+    def log_serial_rx(self, data: Union[str, bytes]) -> None:
+        """Log received serial data (raw bytes are decoded only when logged)."""
         if self._serial_log_file:
+            if isinstance(data, bytes):
+                data = data.decode('utf-8', errors='replace')
             ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
             self._serial_log_file.write(f"RX | {ts} | {data}\n")
             self._serial_log_file.flush()
@@ -132,15 +144,29 @@ class AppLogger:
         if self._gui_callback:
             self._gui_callback(entry)
     
-    def debug(self, message_or_source: str, message: Optional[str] = None) -> None:
-        """Log debug message. Accepts (source, message) or (message)."""
+    def debug(self, message_or_source: str, message: Optional[str] = None, *args) -> None:
+        """
+        Log debug message. Accepts (source, message) or (message).
+        
+        Extra args are %-formatted into message only if debug is enabled.
+        """
+        if not self._debug_enabled:
+            return
+        if args and message is not None:
+            message = message % args
         if message is None:
             self._log("DEBUG", "App", message_or_source)
         else:
             self._log("DEBUG", message_or_source, message)
     
-    def info(self, message_or_source: str, message: Optional[str] = None) -> None:
-        """Log info message. Accepts (source, message) or (message)."""
+    def info(self, message_or_source: str, message: Optional[str] = None, *args) -> None:
+        """
+        Log info message. Accepts (source, message) or (message).
+        
+        Extra args are %-formatted into message, as for debug().
+        """
+        if args and message is not None:
+            message = message % args
         if message is None:
             self._log("INFO", "App", message_or_source)
         else:
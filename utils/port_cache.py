@@ -0,0 +1,53 @@
+"""
+Serial port presence cache for RP2040 Programmer.
+
+Lets callers fail fast on a port that has disappeared without opening it,
+while sharing one port enumeration between checks made close together.
+"""
+import threading
+import time
+from typing import FrozenSet, Optional, Tuple
+
+from serial.tools import list_ports
+
+
+_lock = threading.Lock()
+# (monotonic time of the scan, device paths seen)
+_cache: Optional[Tuple[float, FrozenSet[str]]] = None
+
+
+def _scan() -> FrozenSet[str]:
+    """Enumerate present serial ports and remember the result."""
+    global _cache
+    ports = frozenset(p.device for p in list_ports.comports())
+    with _lock:
+        _cache = (time.monotonic(), ports)
+    return ports
+
+
+def is_port_present(port: str, ttl: float = 1.0) -> bool:
+    """
+    Check whether a serial port is currently present.
+
+    A positive answer from a scan younger than ttl is reused. A miss always
+    rescans first, so a port that just appeared is never reported absent.
+
+    Args:
+        port: Serial port path (e.g., COM3 or /dev/ttyACM0)
+        ttl: Maximum age in seconds of a cached scan
+
+    Returns:
+        True if the port is present
+    """
+    with _lock:
+        cached = _cache
+    if cached is not None and time.monotonic() - cached[0] < ttl and port in cached[1]:
+        return True
+    return port in _scan()
+
+
+def invalidate_port_cache() -> None:
+    """Drop the cached scan (call after opening or closing a port)."""
+    global _cache
+    with _lock:
+        _cache = None